@@ -0,0 +1,41 @@
+"""store refresh tokens as binary
+
+Revision ID: 5d9e2b7a3f10
+Revises: e7a0b35f14c6
+Create Date: 2026-10-16 13:05:27.418260
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d9e2b7a3f10'
+down_revision: Union[str, Sequence[str], None] = 'e7a0b35f14c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing 43-char tokens cannot be converted; their holders log in again
+    op.execute("UPDATE authdata SET refresh_token = NULL, refresh_token_expires_at = NULL")
+    op.alter_column(
+        'authdata', 'refresh_token',
+        existing_type=sa.String(length=255),
+        type_=sa.BINARY(length=16),
+        existing_nullable=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("UPDATE authdata SET refresh_token = NULL, refresh_token_expires_at = NULL")
+    op.alter_column(
+        'authdata', 'refresh_token',
+        existing_type=sa.BINARY(length=16),
+        type_=sa.String(length=255),
+        existing_nullable=True
+    )
@@ -0,0 +1,36 @@
+"""add asset lookup indexes
+
+Revision ID: 8f2c4a1d9e3b
+Revises: 31fd01b8d767
+Create Date: 2026-10-16 10:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2c4a1d9e3b'
+down_revision: Union[str, Sequence[str], None] = '31fd01b8d767'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_asset_avail', 'assetdata',
+        ['AssetType', 'AssignedTo', 'RepairStatus', 'IsTempAsset']
+    )
+    op.create_index(
+        'ix_repair_active', 'repairstatustracker',
+        ['AssetId', 'RepairEndTimestamp']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_repair_active', table_name='repairstatustracker')
+    op.drop_index('ix_asset_avail', table_name='assetdata')
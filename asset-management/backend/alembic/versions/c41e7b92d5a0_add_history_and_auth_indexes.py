@@ -0,0 +1,38 @@
+"""add history and auth indexes
+
+Revision ID: c41e7b92d5a0
+Revises: 8f2c4a1d9e3b
+Create Date: 2026-10-16 11:03:17.552904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e7b92d5a0'
+down_revision: Union[str, Sequence[str], None] = '8f2c4a1d9e3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_ah_asset_assigned', 'assignmenthistory',
+        ['AssetId', 'AssignedOn']
+    )
+    op.create_index(
+        'ix_ah_active', 'assignmenthistory',
+        ['AssetId', 'IsActive', 'EmployeeId']
+    )
+    op.create_index('ix_auth_refresh', 'authdata', ['refresh_token'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_auth_refresh', table_name='authdata')
+    op.drop_index('ix_ah_active', table_name='assignmenthistory')
+    op.drop_index('ix_ah_asset_assigned', table_name='assignmenthistory')
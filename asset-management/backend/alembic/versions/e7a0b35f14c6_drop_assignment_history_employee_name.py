@@ -0,0 +1,37 @@
+"""drop assignment history employee name
+
+Revision ID: e7a0b35f14c6
+Revises: c41e7b92d5a0
+Create Date: 2026-10-16 11:41:52.093311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a0b35f14c6'
+down_revision: Union[str, Sequence[str], None] = 'c41e7b92d5a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_column('assignmenthistory', 'EmployeeName')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column(
+        'assignmenthistory',
+        sa.Column('EmployeeName', sa.String(length=250), nullable=True)
+    )
+    # Restore the snapshot from the current employee names
+    op.execute(
+        "UPDATE assignmenthistory h "
+        "LEFT JOIN peopledata p ON p.NameId = h.EmployeeId "
+        "SET h.EmployeeName = COALESCE(p.Name, h.EmployeeId)"
+    )
@@ -0,0 +1,24 @@
+"""ASGI middleware shared by the API."""
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class APIGZipMiddleware:
+    """
+    GZipMiddleware applied only to requests under path_prefix.
+
+    Frontend routes negotiate their own encodings and per-encoding ETags;
+    the stock middleware would recompress them under the identity ETag and
+    ignore q=0 in Accept-Encoding, so they bypass it entirely.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str = "/api/", **gzip_options):
+        self.app = app
+        self.path_prefix = path_prefix
+        self.gzip = GZipMiddleware(app, **gzip_options)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.path_prefix):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
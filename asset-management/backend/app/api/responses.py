@@ -0,0 +1,74 @@
+"""Response classes shared by the API."""
+import hashlib
+import threading
+from typing import Any, Callable, NamedTuple
+
+import orjson
+from cachetools import LRUCache
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson instead of the stdlib encoder.
+    
+    Used as the app's default_response_class, and returned directly by
+    endpoints whose payloads are already plain values so FastAPI skips its
+    jsonable_encoder pass over them. Defined here rather than taken
+    from fastapi.responses, whose ORJSONResponse is deprecated and warns on
+    every instantiation in current FastAPI releases.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _success_envelope(data: Any) -> dict:
+    return {"success": True, "data": data}
+
+
+class RenderedJSON(NamedTuple):
+    """A rendered response body and its ETag."""
+    source: Any
+    body: bytes
+    etag: str
+
+
+# Rendered bodies per URL path. The data handed to cacheable_json comes out of
+# the repositories' query caches, which return the same object until they are
+# invalidated or expire, so an identity match means the render is current.
+_rendered: LRUCache = LRUCache(maxsize=256)
+_rendered_lock = threading.Lock()
+
+
+def cacheable_json(
+    request: Request,
+    data: Any,
+    envelope: Callable[[Any], Any] = _success_envelope,
+    max_age: int = 60
+) -> Response:
+    """
+    Render envelope(data) with an ETag and a short private Cache-Control.
+    
+    For slowly-changing reference data: browsers reuse it for max_age
+    seconds, then revalidate and get an empty 304 if nothing changed. The
+    body and ETag are rendered once per cached data object, not per request.
+    """
+    key = request.url.path
+    with _rendered_lock:
+        rendered = _rendered.get(key)
+    if rendered is None or rendered.source is not data:
+        body = orjson.dumps(envelope(data), option=orjson.OPT_NON_STR_KEYS)
+        # Weak: GZipMiddleware may compress the body without changing the ETag
+        etag = 'W/"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+        rendered = RenderedJSON(data, body, etag)
+        with _rendered_lock:
+            _rendered[key] = rendered
+    
+    # private: these endpoints sit behind auth, so shared caches must not keep them
+    headers = {"Cache-Control": f"private, max-age={max_age}", "ETag": rendered.etag}
+    # If-None-Match uses weak comparison, so match on the opaque tag alone
+    if rendered.etag[2:] in request.headers.get('if-none-match', ''):
+        return Response(status_code=304, headers=headers)
+    return Response(rendered.body, media_type="application/json", headers=headers)
@@ -1,9 +1,15 @@
-"""Asset routes."""
+"""
+Asset routes.
+
+Handlers are plain ``def`` functions: FastAPI runs them in its threadpool,
+so the blocking SQLAlchemy session calls never stall the event loop.
+"""
 import logging
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 from sqlalchemy.orm import Session
 from typing import Optional
 from app.models.requests import AssetCreateRequest, AssetUpdateRequest, BulkDeleteRequest, BrandModelCreateRequest, RepairStartRequest, RepairEndRequest
+from app.api.responses import ORJSONResponse, cacheable_json
 from app.db.session import get_db
 from app.db.repositories.asset_repository import AssetRepository
 from app.dependencies import get_current_user
@@ -11,20 +17,32 @@ from app.dependencies import get_current_user
 logger = logging.getLogger('routes.assets')
 router = APIRouter()
 
+# Fallback bodies are built once and returned as-is; never mutate them
+_FALLBACK_ASSET_TYPES_RESPONSE = {
+    "success": True,
+    "data": ("Laptop", "Desktop", "Monitor", "Keyboard", "Mouse", "Printer",
+             "Scanner", "Server", "Router", "Switch", "UPS", "Projector",
+             "Tablet", "Mobile Phone", "Headset", "Webcam", "External Hard Drive", "Other"),
+    "source": "fallback"
+}
+_NO_BRANDS_RESPONSE = {"success": True, "data": (), "message": "No brands found"}
+_NO_SPECIFICATIONS_RESPONSE = {"success": False, "data": {}, "message": "Database unavailable"}
+
 
 @router.get("")
-async def get_assets(
+def get_assets(
     _current_user: dict = Depends(get_current_user),  # pylance: disable=unused-argument
     db: Session = Depends(get_db)
 ):
     """Get all assets."""
     repo = AssetRepository(db)
     assets = repo.get_all()
-    return {"success": True, "data": assets}
+    return ORJSONResponse({"success": True, "data": assets})
 
 
 @router.get("/asset-types")
-async def get_asset_types(
+def get_asset_types(
+    request: Request,
     _current_user: dict = Depends(get_current_user),  # pylance: disable=unused-argument
     db: Session = Depends(get_db)
 ):
@@ -32,19 +50,13 @@ async def get_asset_types(
     repo = AssetRepository(db)
     types = repo.get_types()
     if types:
-        return {"success": True, "data": [t['type_name'] for t in types]}
-    return {
-        "success": True,
-        "data": ["Laptop", "Desktop", "Monitor", "Keyboard", "Mouse", "Printer",
-                 "Scanner", "Server", "Router", "Switch", "UPS", "Projector",
-                 "Tablet", "Mobile Phone", "Headset", "Webcam", "External Hard Drive", "Other"],
-        "source": "fallback"
-    }
+        return cacheable_json(request, types)
+    return _FALLBACK_ASSET_TYPES_RESPONSE
 
 # Replace the empty stubs and add new endpoints
 
 @router.get("/asset-brands")
-async def get_asset_brands(
+def get_asset_brands(
     _current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -53,11 +65,11 @@ async def get_asset_brands(
     brands = repo.get_brands()
     if brands:
         return {"success": True, "data": [b['brand_name'] for b in brands]}
-    return {"success": True, "data": [], "message": "No brands found"}
+    return _NO_BRANDS_RESPONSE
 
 
 @router.get("/asset-models")
-async def get_asset_models(
+def get_asset_models(
     brand: Optional[str] = None,
     _current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -72,7 +84,7 @@ async def get_asset_models(
 
 
 @router.get("/asset-brands-by-model")
-async def get_brands_by_model(
+def get_brands_by_model(
     model: str,
     _current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -84,23 +96,24 @@ async def get_brands_by_model(
 
 
 @router.post("/asset-brand-model")
-async def create_brand_model(
+def create_brand_model(
     request: BrandModelCreateRequest,
     _current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Create a new brand-model entry."""
-    logger.info(f"CREATE BRAND-MODEL: Brand='{request.brandName}', Model='{request.modelName}'")
+    logger.debug("CREATE BRAND-MODEL: Brand='%s', Model='%s'", request.brandName, request.modelName)
     try:
         repo = AssetRepository(db)
         result = repo.create_brand_model(request.brandName, request.modelName)
         return result
     except Exception as e:
-        logger.error(f"CREATE BRAND-MODEL: Error - {str(e)}")
+        logger.error("CREATE BRAND-MODEL: Error - %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/specifications")
-async def get_all_specifications(
+def get_all_specifications(
+    request: Request,
     _current_user: dict = Depends(get_current_user),  # pylance: disable=unused-argument
     db: Session = Depends(get_db)
 ):
@@ -108,13 +121,14 @@ async def get_all_specifications(
     repo = AssetRepository(db)
     specs = repo.get_all_specifications()
     if specs:
-        return {"success": True, "data": specs}
-    return {"success": False, "data": {}, "message": "Database unavailable"}
+        return cacheable_json(request, specs)
+    return _NO_SPECIFICATIONS_RESPONSE
 
 
 @router.get("/specifications/{type_name}")
-async def get_specifications_for_type(
+def get_specifications_for_type(
     type_name: str,
+    request: Request,
     _current_user: dict = Depends(get_current_user),  # pylance: disable=unused-argument
     db: Session = Depends(get_db)
 ):
@@ -122,26 +136,26 @@ async def get_specifications_for_type(
     repo = AssetRepository(db)
     specs = repo.get_specifications_for_type(type_name)
     if specs:
-        return {
-            "success": True,
-            "data": {"fields": [{"key": s['field_key'], "label": s['field_label'], "placeholder": s['placeholder']} for s in specs]}
-        }
+        return cacheable_json(
+            request, specs,
+            envelope=lambda fields: {"success": True, "data": {"fields": fields}}
+        )
     return {"success": False, "data": {"fields": []}, "message": f"No specifications found for {type_name}"}
 
 
 @router.get("/assignment-history")
-async def get_all_history(
+def get_all_history(
     _current_user: dict = Depends(get_current_user),  # pylance: disable=unused-argument
     db: Session = Depends(get_db)
 ):
     """Get all assignment history grouped by asset."""
     repo = AssetRepository(db)
     history = repo.get_all_assignment_history()
-    return {"success": True, "data": history}
+    return ORJSONResponse({"success": True, "data": history})
 
 
 @router.get("/assignment-history/{asset_id}")
-async def get_history(
+def get_history(
     asset_id: str,
     _current_user: dict = Depends(get_current_user),  # pylance: disable=unused-argument
     db: Session = Depends(get_db)
@@ -153,7 +167,7 @@ async def get_history(
 
 
 @router.get("/{asset_id}")
-async def get_asset(
+def get_asset(
     asset_id: str,
     _current_user: dict = Depends(get_current_user),  # pylance: disable=unused-argument
     db: Session = Depends(get_db)
@@ -167,13 +181,13 @@ async def get_asset(
 
 
 @router.post("")
-async def create_asset(
+def create_asset(
     request: AssetCreateRequest,
     _current_user: dict = Depends(get_current_user),  # pylance: disable=unused-argument
     db: Session = Depends(get_db)
 ):
     """Create a new asset."""
-    logger.info(f"CREATE ASSET: Serial='{request.serialNumber}', Type='{request.assetType}'")
+    logger.debug("CREATE ASSET: Serial='%s', Type='%s'", request.serialNumber, request.assetType)
     
     try:
         repo = AssetRepository(db)
@@ -181,21 +195,21 @@ async def create_asset(
             asset_data=request.model_dump(),
             specifications=request.specifications
         )
-        logger.info(result)
+        logger.debug(result)
         return result
     except Exception as e:
-        logger.error(f"CREATE ASSET: Error - {str(e)}")
+        logger.error("CREATE ASSET: Error - %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/{asset_id}")
-async def update_asset(
+def update_asset(
     asset_id: str,
     request: AssetUpdateRequest,
     _current_user: dict = Depends(get_current_user),  # pylance: disable=unused-argument
     db: Session = Depends(get_db)
 ):
     """Update asset assignment and repair status."""
-    logger.info(f"UPDATE ASSET: '{asset_id}'")
+    logger.debug("UPDATE ASSET: '%s'", asset_id)
     
     try:
         repo = AssetRepository(db)
@@ -206,35 +220,35 @@ async def update_asset(
         )
         return result
     except Exception as e:
-        logger.error(f"UPDATE ASSET: Error - {str(e)}")
+        logger.error("UPDATE ASSET: Error - %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/bulk-delete")
-async def bulk_delete_assets(
+def bulk_delete_assets(
     request: BulkDeleteRequest,
     _current_user: dict = Depends(get_current_user),  # pylance: disable=unused-argument
     db: Session = Depends(get_db)
 ):
     """Delete multiple assets by IDs."""
-    logger.info(f"BULK DELETE: {len(request.assetIds)} assets")
+    logger.debug("BULK DELETE: %s assets", len(request.assetIds))
     try:
         repo = AssetRepository(db)
         result = repo.delete_bulk(request.assetIds)
         return result
     except Exception as e:
-        logger.error(f"BULK DELETE: Error - {str(e)}")
+        logger.error("BULK DELETE: Error - %s", e)
         raise HTTPException(status_code=500, detail=str(e))
     
 
 @router.get("/available-temp-assets/{asset_id}")
-async def get_available_temp_assets(
+def get_available_temp_assets(
     asset_id: str,
     _current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get available temp assets for a given asset."""
-    logger.info(f"GET TEMP ASSETS: For asset '{asset_id}'")
+    logger.debug("GET TEMP ASSETS: For asset '%s'", asset_id)
     repo = AssetRepository(db)
     asset = repo.get_by_id(asset_id)
     if not asset:
@@ -245,47 +259,47 @@ async def get_available_temp_assets(
 
 
 @router.get("/repair-status/{asset_id}")
-async def get_repair_status(
+def get_repair_status(
     asset_id: str,
     _current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get active repair status for an asset."""
-    logger.info(f"GET REPAIR STATUS: For asset '{asset_id}'")
+    logger.debug("GET REPAIR STATUS: For asset '%s'", asset_id)
     repo = AssetRepository(db)
     repair = repo.get_active_repair(asset_id)
     return {"success": True, "data": repair}
 
 
 @router.post("/repair/start")
-async def start_repair(
+def start_repair(
     request: RepairStartRequest,
     _current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Start repair for an asset."""
-    logger.info(f"START REPAIR: Asset='{request.assetId}'")
+    logger.debug("START REPAIR: Asset='%s'", request.assetId)
     try:
         repo = AssetRepository(db)
         result = repo.start_repair(request.assetId, request.repairDetails, request.tempAssetId)
         return result
     except Exception as e:
-        logger.error(f"START REPAIR: Error - {str(e)}")
+        logger.error("START REPAIR: Error - %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/repair/end")
-async def end_repair(
+def end_repair(
     request: RepairEndRequest,
     _current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """End repair for an asset."""
-    logger.info(f"END REPAIR: Asset='{request.assetId}'")
+    logger.debug("END REPAIR: Asset='%s'", request.assetId)
     try:
         repo = AssetRepository(db)
         result = repo.end_repair(request.assetId)
         return result
     except Exception as e:
-        logger.error(f"END REPAIR: Error - {str(e)}")
+        logger.error("END REPAIR: Error - %s", e)
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -9,6 +9,7 @@ SECURITY ARCHITECTURE:
 """
 import logging
 from fastapi import APIRouter, HTTPException, Depends, Response, Request, Cookie
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Optional
@@ -17,7 +18,7 @@ from app.models.requests import LoginRequest
 from app.models.responses import LoginResponse, TokenValidationResponse, RefreshResponse
 from app.db.session import get_db
 from app.services.auth_service import AuthService
-from app.dependencies import security
+from app.dependencies import get_auth_service, get_security
 from app.config import settings
 
 logger = logging.getLogger('routes.auth')
@@ -55,9 +56,9 @@ def set_refresh_cookie(response: Response, refresh_token: str):
     )
     
     if is_production:
-        logger.warning(f"[auth.py:40] PRODUCTION: Refresh cookie set with secure=True (HTTPS required)")
+        logger.debug("[auth.py:40] PRODUCTION: Refresh cookie set with secure=True (HTTPS required)")
     else:
-        logger.info(f"[auth.py:40] DEVELOPMENT: Refresh cookie set with secure=False (HTTP allowed)")
+        logger.debug("[auth.py:40] DEVELOPMENT: Refresh cookie set with secure=False (HTTP allowed)")
 
 
 def clear_refresh_cookie(response: Response):
@@ -69,9 +70,9 @@ def clear_refresh_cookie(response: Response):
 
 
 @router.post("/login", response_model=LoginResponse)
-async def login(request: LoginRequest, response: Response, db: Session = Depends(get_db)):
+def login(request: LoginRequest, response: Response, db: Session = Depends(get_db)):
     """Authenticate and return access token + set refresh cookie."""
-    logger.info(f"LOGIN REQUEST: User '{request.username}'")
+    logger.debug("LOGIN REQUEST: User '%s'", request.username)
     
     auth_service = AuthService(db)
     result = auth_service.authenticate(request.username, request.password)
@@ -90,12 +91,12 @@ async def login(request: LoginRequest, response: Response, db: Session = Depends
             expires_at=result["expires_at"]
         )
     
-    logger.warning(f"LOGIN FAILED: User '{request.username}'")
+    logger.warning("LOGIN FAILED: User '%s'", request.username)
     raise HTTPException(status_code=401, detail="Invalid username or password")
 
 
 @router.post("/refresh", response_model=RefreshResponse)
-async def refresh_token(
+def refresh_token(
     request: Request,
     response: Response,
     db: Session = Depends(get_db),
@@ -103,11 +104,11 @@ async def refresh_token(
 ):
     """Refresh access token using refresh token from cookie."""
     # Debug: Log all cookies received
-    logger.info(f"[auth.py:95] REFRESH REQUEST - Cookies: {request.cookies}")
-    logger.info(f"[auth.py:96] REFRESH REQUEST - Cookie param: {refresh_token}")
+    logger.debug("[auth.py:95] REFRESH REQUEST - Cookies: %s", request.cookies)
+    logger.debug("[auth.py:96] REFRESH REQUEST - Cookie param: %s", refresh_token)
     
     if not refresh_token:
-        logger.warning(f"[auth.py:98] REFRESH: No refresh token cookie present. Cookies received: {dict(request.cookies)}")
+        logger.warning("[auth.py:98] REFRESH: No refresh token cookie present. Cookies received: %s", dict(request.cookies))
         raise HTTPException(status_code=401, detail="Refresh token missing")
     
     auth_service = AuthService(db)
@@ -132,7 +133,7 @@ async def refresh_token(
 
 
 @router.post("/logout")
-async def logout(
+def logout(
     request: Request,
     response: Response,
     db: Session = Depends(get_db),
@@ -145,7 +146,7 @@ async def logout(
         user = auth_service.validate_refresh_for_logout(refresh_token)
         if user:
             auth_service.logout(user['id'])
-            logger.info(f"LOGOUT: Invalidated refresh token for user_id={user['id']}")
+            logger.info("LOGOUT: Invalidated refresh token for user_id=%s", user['id'])
     
     # Always clear cookie
     clear_refresh_cookie(response)
@@ -154,10 +155,12 @@ async def logout(
 
 
 @router.get("/verify", response_model=TokenValidationResponse)
-async def verify_auth(credentials: HTTPAuthorizationCredentials = Depends(security)):
+async def verify_auth(
+    credentials: HTTPAuthorizationCredentials = Depends(get_security()),
+    auth_service: AuthService = Depends(get_auth_service)
+):
     """Verify if access token is still valid."""
-    auth_service = AuthService(session=None)
-    payload = auth_service.verify_token(credentials.credentials)
+    payload = await run_in_threadpool(auth_service.verify_token, credentials.credentials)
     
     if payload:
         return TokenValidationResponse(
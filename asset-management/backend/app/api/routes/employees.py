@@ -2,6 +2,7 @@
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
 
+from app.api.responses import ORJSONResponse
 from app.db.session import get_db
 from app.db.repositories.employee_repository import EmployeeRepository
 from app.dependencies import get_current_user
@@ -10,18 +11,18 @@ router = APIRouter()
 
 
 @router.get("")
-async def get_employees(
+def get_employees(
     _current_user: dict = Depends(get_current_user),  # pylance: disable=unused-argument
     db: Session = Depends(get_db)
 ):
     """Get all employees."""
     repo = EmployeeRepository(db)
     employees = repo.get_all()
-    return {"success": True, "data": employees}
+    return ORJSONResponse({"success": True, "data": employees})
 
 
 @router.get("/{employee_id}")
-async def get_employee(
+def get_employee(
     employee_id: str,
     _current_user: dict = Depends(get_current_user),  # pylance: disable=unused-argument
     db: Session = Depends(get_db)
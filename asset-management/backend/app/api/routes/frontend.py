@@ -1,67 +1,193 @@
 """Frontend serving routes."""
-import os
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import HTMLResponse, FileResponse
+import gzip
+import hashlib
+import mimetypes
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import HTMLResponse
 
 from app.config import settings
 
 router = APIRouter()
 
-FRONTEND_DIST_ABS = os.path.abspath(
-    os.path.join(os.path.dirname(__file__), '../../..', settings.FRONTEND_DIST_PATH)
-)
-
-
-async def serve_frontend():
-    """Serve the frontend index.html."""
-    index_path = os.path.join(FRONTEND_DIST_ABS, 'index.html')
-    if os.path.exists(index_path):
-        with open(index_path, 'r') as f:
-            return HTMLResponse(content=f.read())
-    return HTMLResponse(content="<h1>Frontend not built. Run: npm run build</h1>", status_code=200)
+# Resolved once at import; handlers never re-resolve paths per request
+FRONTEND_DIST: Path = settings.frontend_dist
+ASSETS_DIR: Path = FRONTEND_DIST / 'assets'
+INDEX_PATH: Path = FRONTEND_DIST / 'index.html'
+
+# Vite emits content-hashed file names under dist/assets, so they never change
+# for a given URL and can be cached by browsers forever.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Other dist files (vite.svg, favicon, robots.txt, ...) keep stable names
+# across builds, so browsers must revalidate them through the ETag.
+REVALIDATE_CACHE_CONTROL = "no-cache"
+_COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+
+
+class CachedAsset(NamedTuple):
+    """A dist file held in memory with its precomputed variants."""
+    body: bytes
+    media_type: str
+    etag: str
+    gzip_body: Optional[bytes]
+    br_body: Optional[bytes]
+
+
+_ASSET_CACHE: Dict[str, CachedAsset] = {}
+_PRECOMPRESSED_SUFFIXES = ('.br', '.gz')
+
+
+def _read_sibling(path: Path, suffix: str) -> Optional[bytes]:
+    """Return the build's precompressed copy of path (e.g. app.js.br), if any."""
+    sibling = path.with_name(path.name + suffix)
+    return sibling.read_bytes() if sibling.is_file() else None
+
+
+def _build_cached_asset(path: Path) -> CachedAsset:
+    body = path.read_bytes()
+    media_type = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+    etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+    
+    # Prefer variants emitted at build time; gzip the rest ourselves
+    br_body = _read_sibling(path, '.br')
+    gzip_body = _read_sibling(path, '.gz')
+    if gzip_body is None and media_type.startswith(_COMPRESSIBLE_TYPES):
+        compressed = gzip.compress(body, compresslevel=9, mtime=0)
+        if len(compressed) < len(body):
+            gzip_body = compressed
+    return CachedAsset(body, media_type, etag, gzip_body, br_body)
+
+
+def _load_directory(directory: Path, skip_dir: Optional[Path] = None) -> Dict[str, CachedAsset]:
+    """Read every file under directory into memory, keyed by relative path."""
+    cache: Dict[str, CachedAsset] = {}
+    if not directory.is_dir():
+        return cache
+    for path in directory.rglob('*'):
+        if not path.is_file():
+            continue
+        if skip_dir is not None and path.is_relative_to(skip_dir):
+            continue
+        # Precompressed siblings are folded into their original's entry
+        if path.suffix in _PRECOMPRESSED_SUFFIXES and path.with_suffix('').is_file():
+            continue
+        cache[path.relative_to(directory).as_posix()] = _build_cached_asset(path)
+    return cache
+
+
+def load_asset_cache() -> int:
+    """Read every file under dist/assets into memory. Returns the file count."""
+    _ASSET_CACHE.clear()
+    _ASSET_CACHE.update(_load_directory(ASSETS_DIR))
+    return len(_ASSET_CACHE)
+
+
+# The rest of dist, outside assets/. The SPA fallback serves these from memory
+# and treats any other path as a client-side route.
+_STATIC_FILE_CACHE: Dict[str, CachedAsset] = {}
+
+
+def load_static_files() -> int:
+    """Read the files in dist outside assets/ into memory. Returns the file count."""
+    _STATIC_FILE_CACHE.clear()
+    _STATIC_FILE_CACHE.update(_load_directory(FRONTEND_DIST, skip_dir=ASSETS_DIR))
+    # index.html is served by serve_frontend, never as a plain static file
+    _STATIC_FILE_CACHE.pop(INDEX_PATH.name, None)
+    return len(_STATIC_FILE_CACHE)
+
+
+def _accepted_encodings(request: Request) -> set:
+    """Content codings the client accepts; those sent with q=0 are refused."""
+    accepted = set()
+    for item in request.headers.get('accept-encoding', '').split(','):
+        coding, *params = item.split(';')
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+# index.html only changes between deploys; it is read once at startup and
+# revalidated by browsers through its ETag.
+_INDEX_NOT_BUILT = b"<h1>Frontend not built. Run: npm run build</h1>"
+_INDEX_HTML: bytes = _INDEX_NOT_BUILT
+_INDEX_ETAG: str = '"' + hashlib.blake2b(_INDEX_HTML, digest_size=8).hexdigest() + '"'
+
+
+def load_index_html() -> bool:
+    """Read index.html into memory. Returns False if the frontend is not built."""
+    global _INDEX_HTML, _INDEX_ETAG
+    try:
+        _INDEX_HTML = INDEX_PATH.read_bytes()
+        found = True
+    except FileNotFoundError:
+        _INDEX_HTML = _INDEX_NOT_BUILT
+        found = False
+    _INDEX_ETAG = '"' + hashlib.blake2b(_INDEX_HTML, digest_size=8).hexdigest() + '"'
+    return found
+
+
+async def serve_frontend(request: Request):
+    """Serve the cached frontend index.html."""
+    headers = {"Cache-Control": "no-cache", "ETag": _INDEX_ETAG}
+    if _INDEX_ETAG in request.headers.get('if-none-match', ''):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=_INDEX_HTML, headers=headers)
 
 
 @router.get("/", response_class=HTMLResponse)
-async def root():
-    return await serve_frontend()
-
-
-@router.get("/login", response_class=HTMLResponse)
-async def login_page():
-    return await serve_frontend()
-
-
-@router.get("/asset_addition", response_class=HTMLResponse)
-async def asset_addition_page():
-    return await serve_frontend()
-
-
-@router.get("/asset_assignment", response_class=HTMLResponse)
-async def asset_assignment_page():
-    return await serve_frontend()
-
-
-@router.get("/summary", response_class=HTMLResponse)
-async def summary_page():
-    return await serve_frontend()
-
-
-@router.get("/delete_asset", response_class=HTMLResponse)
-async def delete_asset_page():
-    return await serve_frontend()
-
-
-@router.get("/vite.svg")
-async def vite_svg():
-    svg_path = os.path.join(FRONTEND_DIST_ABS, 'vite.svg')
-    if os.path.exists(svg_path):
-        return FileResponse(svg_path)
-    raise HTTPException(status_code=404)
-
-
+async def root(request: Request):
+    return await serve_frontend(request)
+
+
+def _cached_response(asset: CachedAsset, request: Request, cache_control: str) -> Response:
+    """Build the response for a cached file, honouring ETags and Accept-Encoding."""
+    accepted = _accepted_encodings(request)
+    if asset.br_body is not None and 'br' in accepted:
+        body, encoding = asset.br_body, 'br'
+    elif asset.gzip_body is not None and 'gzip' in accepted:
+        body, encoding = asset.gzip_body, 'gzip'
+    else:
+        body, encoding = asset.body, None
+    
+    # Each encoding is its own representation, so it gets its own strong ETag
+    etag = asset.etag if encoding is None else f'{asset.etag[:-1]}-{encoding}"'
+    headers = {
+        "Cache-Control": cache_control,
+        "ETag": etag,
+        "Vary": "Accept-Encoding",
+    }
+    if etag in request.headers.get('if-none-match', ''):
+        return Response(status_code=304, headers=headers)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type=asset.media_type, headers=headers)
+
+
+@router.get("/assets/{asset_path:path}")
+async def serve_asset(asset_path: str, request: Request):
+    """Serve a built asset from the in-memory cache."""
+    asset = _ASSET_CACHE.get(asset_path)
+    if asset is None:
+        raise HTTPException(status_code=404)
+    return _cached_response(asset, request, IMMUTABLE_CACHE_CONTROL)
+
+
+# Registered last: top-level dist files (vite.svg, favicon, ...) come from
+# memory, and every other path is a client-side page (/login, /summary, ...)
+# that resolves to index.html.
 @router.get("/{full_path:path}")
-async def catch_all(full_path: str):
-    file_path = os.path.join(FRONTEND_DIST_ABS, full_path)
-    if os.path.exists(file_path) and os.path.isfile(file_path):
-        return FileResponse(file_path)
-    return await serve_frontend()
\ No newline at end of file
+async def catch_all(full_path: str, request: Request):
+    asset = _STATIC_FILE_CACHE.get(full_path)
+    if asset is not None:
+        return _cached_response(asset, request, REVALIDATE_CACHE_CONTROL)
+    return await serve_frontend(request)
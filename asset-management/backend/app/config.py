@@ -1,5 +1,8 @@
 """Application configuration."""
 import os
+from pathlib import Path
+from typing import List
+
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,6 +16,15 @@ class Settings:
     DB_USER: str = os.getenv('DB_USER', 'root')
     DB_PASSWORD: str = os.getenv('DB_PASSWORD', 'root')
     DB_NAME: str = os.getenv('DB_NAME', 'ITAssetData')
+    DB_POOL_SIZE: int = int(os.getenv('DB_POOL_SIZE', 20))
+    DB_MAX_OVERFLOW: int = int(os.getenv('DB_MAX_OVERFLOW', 30))
+    DB_POOL_TIMEOUT: int = int(os.getenv('DB_POOL_TIMEOUT', 10))
+    DB_POOL_RECYCLE: int = int(os.getenv('DB_POOL_RECYCLE', 1800))
+    DB_QUERY_CACHE_SIZE: int = int(os.getenv('DB_QUERY_CACHE_SIZE', 1200))
+    # Connections opened at startup, per worker; the rest open on demand
+    DB_POOL_WARMUP: int = int(os.getenv('DB_POOL_WARMUP', 5))
+    # Skip table/view setup at startup when migrations are run separately
+    SKIP_DB_INIT: bool = os.getenv('SKIP_DB_INIT', 'False').lower() in ('1', 'true')
     
    # REPLACE JWT section (lines 17-20) with:
     # JWT
@@ -21,33 +33,47 @@ class Settings:
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     JWT_EXPIRY_HOURS: int = int(os.getenv('JWT_EXPIRY_HOURS', 24))
     REFRESH_TOKEN_EXPIRE_HOURS: int = 24
+    # Verified access-token payloads kept in memory to skip repeat signature checks
+    TOKEN_CACHE_SIZE: int = int(os.getenv('TOKEN_CACHE_SIZE', 10000))
+    TOKEN_CACHE_TTL: int = int(os.getenv('TOKEN_CACHE_TTL', 60))
     
     
     # Server
     SERVER_HOST: str = os.getenv('SERVER_HOST', '127.0.0.1')
     SERVER_PORT: int = int(os.getenv('SERVER_PORT', 8000))
     DEBUG: bool = os.getenv('DEBUG', 'True').lower() == 'true'
+    # Each worker process has its own DB pool (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    # and its own query caches: writes invalidate only the worker that made
+    # them, so other workers serve stale reference data until the TTL expires
+    UVICORN_WORKERS: int = int(os.getenv('UVICORN_WORKERS', 1))
+    # Per-request trace lines are logged at DEBUG; INFO keeps only writes and startup
+    LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO').upper()
     # Note: Set DEBUG=False in production .env to enable HTTPS-only cookies
     
     # Frontend
     FRONTEND_DIST_PATH: str = os.getenv('FRONTEND_DIST_PATH', '../dist')
     
+    # CORS: comma-separated origins allowed to call the API with credentials
+    CORS_ORIGINS: List[str] = [
+        origin.strip() for origin in os.getenv(
+            'CORS_ORIGINS',
+            'http://localhost:3000,http://127.0.0.1:3000,'   # Frontend dev server (Vite)
+            'http://localhost:8000,http://127.0.0.1:8000,'   # Backend serving frontend
+            'https://localhost,https://127.0.0.1'            # HTTPS production
+        ).split(',') if origin.strip()
+    ]
+    
     @property
-    def db_config(self) -> dict:
-        """Legacy config for backwards compatibility."""
-        return {
-            'host': self.DB_HOST,
-            'user': self.DB_USER,
-            'password': self.DB_PASSWORD,
-            'database': self.DB_NAME
-        }
+    def frontend_dist(self) -> Path:
+        """Absolute path of the built frontend, relative paths taken from the backend dir."""
+        return (Path(__file__).resolve().parent.parent / self.FRONTEND_DIST_PATH).resolve()
     
     @property
     def database_url(self) -> str:
         """SQLAlchemy database URL."""
         return (
-            f"mysql+mysqlconnector://{self.DB_USER}:{self.DB_PASSWORD}"
-            f"@{self.DB_HOST}/{self.DB_NAME}"
+            f"mysql+mysqldb://{self.DB_USER}:{self.DB_PASSWORD}"
+            f"@{self.DB_HOST}/{self.DB_NAME}?charset=utf8mb4"
         )
 
 
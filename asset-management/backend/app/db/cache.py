@@ -0,0 +1,70 @@
+"""
+In-process caching for slowly-changing query results.
+Results are shared by every request handled by this worker process. With
+several uvicorn workers, invalidate() only reaches the calling worker; the
+others catch up when their entries expire.
+"""
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+from cachetools import TTLCache
+
+_MISSING = object()
+
+
+class QueryCache:
+    """
+    Thread-safe TTL cache for query results that rarely change.
+
+    Entries expire after ``ttl`` seconds; writers that change the underlying
+    tables call ``invalidate()`` so readers never wait out the TTL.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._generation = 0
+        # Loads in flight, so concurrent misses for the same key wait on one
+        # query and share its result, or its exception, instead of each
+        # running their own
+        self._pending: Dict[Hashable, Future] = {}
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling loader once on a miss."""
+        with self._lock:
+            value = self._cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            future = self._pending.get(key)
+            if future is not None:
+                loading = False
+            else:
+                future = self._pending[key] = Future()
+                generation = self._generation
+                loading = True
+
+        if not loading:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            # Don't store a result loaded before a concurrent invalidate()
+            if generation == self._generation:
+                self._cache[key] = value
+            self._pending.pop(key, None)
+        future.set_result(value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._cache.clear()
+            self._generation += 1
@@ -48,5 +48,5 @@ def init_database() -> bool:
         return True
         
     except Exception as e:
-        logger.error(f"Error initializing database: {e}")
+        logger.error("Error initializing database: %s", e)
         return False
\ No newline at end of file
@@ -1,8 +1,8 @@
 from datetime import datetime, date
 from typing import Optional, List
 from sqlalchemy import (
-    String, Integer, Float, Boolean, Date, Text,
-    ForeignKey, UniqueConstraint, CheckConstraint
+    String, Integer, Float, Boolean, Date, Text, BINARY,
+    ForeignKey, UniqueConstraint, CheckConstraint, Index
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -25,7 +25,8 @@ class AuthData(Base):
     email: Mapped[Optional[str]] = mapped_column(String(100))
     
     # Refresh token fields
-    refresh_token: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    # Raw 128-bit token; clients hold its unpadded base64url form
+    refresh_token: Mapped[Optional[bytes]] = mapped_column(BINARY(16), nullable=True)
     refresh_token_expires_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
@@ -35,6 +36,10 @@ class AuthData(Base):
         TIMESTAMP, server_default=func.current_timestamp(), nullable=True
     )
 
+    __table_args__ = (
+        Index('ix_auth_refresh', 'refresh_token'),
+    )
+
 
 class AssetType(Base):
     __tablename__ = "assettypes"
@@ -90,6 +95,8 @@ class AssetData(Base):
     __tablename__ = "assetdata"
     __table_args__ = (
         UniqueConstraint('SerialNo', 'Brand', 'AssetType', name='unique_serial_brand_type'),
+        # Serves the available-temp-asset lookup (same type, unassigned, not in repair)
+        Index('ix_asset_avail', 'AssetType', 'AssignedTo', 'RepairStatus', 'IsTempAsset'),
     )
 
     AssetId: Mapped[str] = mapped_column(String(100), primary_key=True)
@@ -107,9 +114,9 @@ class AssetData(Base):
         ForeignKey("peopledata.NameId", ondelete="SET NULL")
     )
 
-    RepairStatus: Mapped[bool] = mapped_column(TINYINT(1), nullable=False, default=0)
-    IsTempAsset: Mapped[bool] = mapped_column(TINYINT(1), nullable=False, default=0)
-    IsRental: Mapped[bool] = mapped_column(TINYINT(1), nullable=False, default=0)
+    RepairStatus: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    IsTempAsset: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    IsRental: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     AssetImagePath: Mapped[Optional[str]] = mapped_column(String(250))
     PurchaseReceiptsPath: Mapped[Optional[str]] = mapped_column(String(250))
     WarrantyCardPath: Mapped[Optional[str]] = mapped_column(String(250))
@@ -121,8 +128,14 @@ class AssetData(Base):
         TIMESTAMP, server_default=func.current_timestamp(), nullable=True
     )
     assigned_employee: Mapped[Optional["PeopleData"]] = relationship(back_populates="assigned_assets")
-    spec_data: Mapped[List["SpecData"]] = relationship(back_populates="asset", cascade="all, delete-orphan")
-    assignment_history: Mapped[List["AssignmentHistory"]] = relationship(back_populates="asset", cascade="all, delete-orphan")
+    # Child rows are removed by the ON DELETE CASCADE foreign keys; passive_deletes
+    # stops the ORM from loading and deleting them one by one first.
+    spec_data: Mapped[List["SpecData"]] = relationship(
+        back_populates="asset", cascade="all, delete-orphan", passive_deletes=True
+    )
+    assignment_history: Mapped[List["AssignmentHistory"]] = relationship(
+        back_populates="asset", cascade="all, delete-orphan", passive_deletes=True
+    )
 
 
 class SpecData(Base):
@@ -147,11 +160,16 @@ class AssetIdCounter(Base):
 
 class AssignmentHistory(Base):
     __tablename__ = "assignmenthistory"
+    __table_args__ = (
+        # Per-asset history listing, newest first
+        Index('ix_ah_asset_assigned', 'AssetId', 'AssignedOn'),
+        # Closing the active assignment of an asset
+        Index('ix_ah_active', 'AssetId', 'IsActive', 'EmployeeId'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     AssetId: Mapped[str] = mapped_column(ForeignKey("assetdata.AssetId", ondelete="CASCADE"), nullable=False)
     EmployeeId: Mapped[str] = mapped_column(ForeignKey("peopledata.NameId", ondelete="CASCADE"), nullable=False)
-    EmployeeName: Mapped[Optional[str]] = mapped_column(String(250))
     AssignedOn: Mapped[date] = mapped_column(Date, nullable=False)
     ReturnedOn: Mapped[Optional[date]] = mapped_column(Date)
 
@@ -180,4 +198,6 @@ class RepairStatusTracker(Base):
 
     __table_args__ = (
         CheckConstraint("AssetId <> TempAssetId", name="chk_assetid_tempid_not_same"),
+        # Serves the active-repair lookup (RepairEndTimestamp IS NULL)
+        Index('ix_repair_active', 'AssetId', 'RepairEndTimestamp'),
     )
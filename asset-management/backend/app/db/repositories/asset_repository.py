@@ -1,12 +1,18 @@
 """Asset repository using SQLAlchemy ORM."""
 import logging
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from typing import Optional, Dict, List
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import (
+    JSON, bindparam, case, exists, func, literal, true, select, insert, update, delete
+)
 from sqlalchemy.orm import Session, joinedload
 
+from app.db.cache import QueryCache
 from app.db.repositories.base import BaseRepository
+from app.db.repositories.summary_repository import invalidate_summary_cache
 from app.db.models import (
     AssetData, AssetType, AssetSpecification, SpecData,
     AssignmentHistory, PeopleData, AssetIdCounter, BrandData, RepairStatusTracker
@@ -14,6 +20,36 @@ from app.db.models import (
 
 logger = logging.getLogger('db.asset_repository')
 
+# Asset types and spec field definitions are only edited directly in the
+# database, never through the API, so they are cached process-wide and
+# picked up again when the 60s TTL expires.
+_reference_cache = QueryCache(maxsize=256, ttl=60)
+# Brand/model pairs are read on every asset form and written only through
+# create_brand_model, which drops this cache.
+_brand_cache = QueryCache(maxsize=256, ttl=60)
+
+# History rows store only EmployeeId; names are resolved against PeopleData
+# at read time (falling back to the ID, as the old write-time snapshot did).
+_history_employee_name = func.coalesce(PeopleData.Name, AssignmentHistory.EmployeeId)
+# Dates are formatted by MySQL so history reads never build datetime objects
+_history_assigned_on = func.date_format(AssignmentHistory.AssignedOn, '%Y-%m-%d')
+_history_returned_on = case(
+    (AssignmentHistory.IsActive == True, 'Active'),
+    else_=func.date_format(AssignmentHistory.ReturnedOn, '%Y-%m-%d')
+)
+
+# Point lookups used on every asset page, built once and bound per call
+_ASSET_BY_ID = (
+    select(AssetData)
+    .options(joinedload(AssetData.spec_data))
+    .where(AssetData.AssetId == bindparam('asset_id'))
+)
+_ACTIVE_REPAIR_BY_ASSET = (
+    select(RepairStatusTracker)
+    .where(RepairStatusTracker.AssetId == bindparam('asset_id'))
+    .where(RepairStatusTracker.RepairEndTimestamp == None)
+)
+
 
 class AssetRepository(BaseRepository[AssetData]):
     """Repository for asset operations using SQLAlchemy ORM."""
@@ -21,46 +57,62 @@ class AssetRepository(BaseRepository[AssetData]):
     def __init__(self, session: Session):
         super().__init__(AssetData, session)
     
-    def get_types(self) -> List[dict]:
-        """Get all asset types."""
-        logger.info("FETCH: Getting all asset types")
-        stmt = select(AssetType).order_by(AssetType.type_name)
-        types = self.session.scalars(stmt).all()
-        return [{"id": t.id, "type_name": t.type_name} for t in types]
+    def get_types(self) -> List[str]:
+        """Get all asset type names (cached)."""
+        return _reference_cache.get_or_load(('types',), self._load_types)
+    
+    def _load_types(self) -> List[str]:
+        logger.debug("FETCH: Getting all asset types")
+        stmt = select(AssetType.type_name).order_by(AssetType.type_name)
+        return list(self.session.scalars(stmt))
     
-    # Add these new methods to the AssetRepository class
-
     def get_brands(self) -> List[dict]:
-        """Get all unique asset brands."""
-        logger.info("FETCH: Getting all unique asset brands")
+        """Get all unique asset brands (cached)."""
+        return _brand_cache.get_or_load(('brands',), self._load_brands)
+    
+    def _load_brands(self) -> List[dict]:
+        logger.debug("FETCH: Getting all unique asset brands")
         stmt = select(BrandData.brand_name).distinct().order_by(BrandData.brand_name)
         brands = self.session.scalars(stmt).all()
         return [{"brand_name": b} for b in brands]
 
     def get_models(self) -> List[dict]:
-        """Get all asset models with their brands."""
-        logger.info("FETCH: Getting all asset models")
+        """Get all asset models with their brands (cached)."""
+        return _brand_cache.get_or_load(('models',), self._load_models)
+    
+    def _load_models(self) -> List[dict]:
+        logger.debug("FETCH: Getting all asset models")
         stmt = select(BrandData).order_by(BrandData.brand_name, BrandData.model_name)
         models = self.session.scalars(stmt).all()
         return [{"id": m.id, "brand_name": m.brand_name, "model_name": m.model_name} for m in models]
 
     def get_models_by_brand(self, brand_name: str) -> List[dict]:
-        """Get models filtered by brand name."""
-        logger.info(f"FETCH: Getting models for brand '{brand_name}'")
+        """Get models filtered by brand name (cached)."""
+        return _brand_cache.get_or_load(
+            ('models', brand_name), lambda: self._load_models_by_brand(brand_name)
+        )
+    
+    def _load_models_by_brand(self, brand_name: str) -> List[dict]:
+        logger.debug("FETCH: Getting models for brand '%s'", brand_name)
         stmt = select(BrandData).where(BrandData.brand_name == brand_name).order_by(BrandData.model_name)
         models = self.session.scalars(stmt).all()
         return [{"id": m.id, "model_name": m.model_name} for m in models]
 
     def get_brands_by_model(self, model_name: str) -> List[dict]:
-        """Get brands filtered by model name."""
-        logger.info(f"FETCH: Getting brands for model '{model_name}'")
+        """Get brands filtered by model name (cached)."""
+        return _brand_cache.get_or_load(
+            ('brands', model_name), lambda: self._load_brands_by_model(model_name)
+        )
+    
+    def _load_brands_by_model(self, model_name: str) -> List[dict]:
+        logger.debug("FETCH: Getting brands for model '%s'", model_name)
         stmt = select(BrandData).where(BrandData.model_name == model_name).order_by(BrandData.brand_name)
         brands = self.session.scalars(stmt).all()
         return [{"id": b.id, "brand_name": b.brand_name} for b in brands]
 
     def create_brand_model(self, brand_name: str, model_name: str) -> dict:
         """Create a new brand-model entry."""
-        logger.info(f"CREATE: Adding brand '{brand_name}' with model '{model_name}'")
+        logger.debug("CREATE: Adding brand '%s' with model '%s'", brand_name, model_name)
         try:
             # Check if combination already exists
             stmt = select(BrandData).where(
@@ -69,22 +121,26 @@ class AssetRepository(BaseRepository[AssetData]):
             )
             existing = self.session.scalars(stmt).first()
             if existing:
-                logger.info(f"CREATE: Brand-model combination already exists (id={existing.id})")
+                logger.debug("CREATE: Brand-model combination already exists (id=%s)", existing.id)
                 return {"success": True, "id": existing.id, "message": "Brand-model combination already exists"}
             
             new_entry = BrandData(brand_name=brand_name, model_name=model_name)
             self.session.add(new_entry)
             self.session.commit()
-            logger.info(f"CREATE: Successfully added brand-model (id={new_entry.id})")
+            _brand_cache.invalidate()
+            logger.info("CREATE: Successfully added brand-model (id=%s)", new_entry.id)
             return {"success": True, "id": new_entry.id, "message": "Brand-model added successfully"}
         except Exception as e:
             self.session.rollback()
-            logger.error(f"CREATE: Error adding brand-model - {e}")
+            logger.error("CREATE: Error adding brand-model - %s", e)
             raise
     
     def get_all_specifications(self) -> Dict[str, dict]:
-        """Get all specifications grouped by asset type."""
-        logger.info("FETCH: Getting all specifications")
+        """Get all specifications grouped by asset type (cached)."""
+        return _reference_cache.get_or_load(('specs',), self._load_all_specifications)
+    
+    def _load_all_specifications(self) -> Dict[str, dict]:
+        logger.debug("FETCH: Getting all specifications")
         
         stmt = (
             select(AssetSpecification)
@@ -108,72 +164,103 @@ class AssetRepository(BaseRepository[AssetData]):
         return result
     
     def get_specifications_for_type(self, type_name: str) -> List[dict]:
-        """Get specification fields for a given asset type."""
-        logger.info(f"FETCH: Getting specifications for type '{type_name}'")
+        """Get specification fields (key, label, placeholder) for an asset type (cached)."""
+        return _reference_cache.get_or_load(
+            ('specs', type_name), lambda: self._load_specifications_for_type(type_name)
+        )
+    
+    def _load_specifications_for_type(self, type_name: str) -> List[dict]:
+        logger.debug("FETCH: Getting specifications for type '%s'", type_name)
         
+        # Columns are labelled with the API's field names, so rows are the
+        # response items as-is
         stmt = (
-            select(AssetSpecification)
+            select(
+                AssetSpecification.field_key.label('key'),
+                AssetSpecification.field_label.label('label'),
+                AssetSpecification.placeholder
+            )
             .join(AssetType)
             .where(AssetType.type_name == type_name)
             .order_by(AssetSpecification.id)
         )
-        specs = self.session.scalars(stmt).all()
-        
-        return [
-            {
-                'field_key': s.field_key,
-                'field_label': s.field_label,
-                'placeholder': s.placeholder
+        return [dict(row) for row in self.session.execute(stmt).mappings()]
+    
+    def _field_mapping_for_type(self, type_name: str) -> Dict[str, str]:
+        """Get the field_key -> field_label mapping for an asset type (cached)."""
+        # Derived from the cached spec list, which the asset addition form has
+        # usually loaded already, so create() rarely queries for it at all.
+        return _reference_cache.get_or_load(
+            ('field_mapping', type_name),
+            lambda: {
+                s['key']: s['label']
+                for s in self.get_specifications_for_type(type_name)
             }
-            for s in specs
-        ]
+        )
     
     def get_all(self) -> Dict[str, dict]:
         """Get all assets with their specifications."""
-        logger.info("FETCH: Getting all assets")
+        logger.debug("FETCH: Getting all assets")
         
+        # One LEFT JOIN over plain columns (no entity hydration); rows come
+        # back ordered by AssetId so each asset's specs are contiguous.
         stmt = (
-            select(AssetData)
-            .options(joinedload(AssetData.spec_data))
+            select(
+                AssetData.AssetId,
+                AssetData.SerialNo,
+                AssetData.AssetType,
+                AssetData.Brand,
+                AssetData.Model,
+                AssetData.AssignedTo,
+                AssetData.RepairStatus,
+                AssetData.IsTempAsset,
+                AssetData.IsRental,
+                AssetData.WarrantyExpiry,
+                AssetData.LeaseExpiry,
+                SpecData.SpecFieldName,
+                SpecData.SpecFieldValue
+            )
+            .outerjoin(SpecData, SpecData.AssetId == AssetData.AssetId)
             .order_by(AssetData.AssetId)
+            # Stream through a server-side cursor instead of buffering every
+            # asset x spec row client-side before the first one is processed
+            .execution_options(yield_per=1000)
         )
-        assets = self.session.scalars(stmt).unique().all()
         
         result = {}
-        for asset in assets:
-            specifications = {
-                spec.SpecFieldName: spec.SpecFieldValue 
-                for spec in asset.spec_data
-            }
-            specifications['brand'] = asset.Brand
-            specifications['model'] = asset.Model
-            
-            result[asset.AssetId] = {
-                'assetId': asset.AssetId,
-                'serialNumber': asset.SerialNo,
-                'assetType': asset.AssetType,
+        for asset_id, rows in groupby(self.session.execute(stmt), key=itemgetter(0)):
+            first = next(rows)
+            (_, serial_no, asset_type, brand, model, assigned_to,
+             repair_status, is_temp, is_rental, warranty_expiry, lease_expiry) = first[:11]
+            
+            specifications = {}
+            for row in (first, *rows):
+                if row[11] is not None:
+                    specifications[row[11]] = row[12]
+            specifications['brand'] = brand
+            specifications['model'] = model
+            
+            result[asset_id] = {
+                'assetId': asset_id,
+                'serialNumber': serial_no,
+                'assetType': asset_type,
                 'specifications': specifications,
-                'assignedTo': asset.AssignedTo,
-                'repairStatus': bool(asset.RepairStatus),
-                'isTempAsset': bool(asset.IsTempAsset),
-                'isRental': bool(asset.IsRental),
-                'warrantyExpiry': asset.WarrantyExpiry,
-                'leaseExpiry': asset.LeaseExpiry
+                'assignedTo': assigned_to,
+                'repairStatus': repair_status,
+                'isTempAsset': is_temp,
+                'isRental': is_rental,
+                'warrantyExpiry': warranty_expiry,
+                'leaseExpiry': lease_expiry
             }
         
-        logger.info(f"FETCH: Retrieved {len(result)} assets")
+        logger.debug("FETCH: Retrieved %s assets", len(result))
         return result
     
     def get_by_id(self, asset_id: str) -> Optional[dict]:
         """Get a single asset by ID with specifications."""
-        logger.info(f"FETCH: Getting asset '{asset_id}'")
+        logger.debug("FETCH: Getting asset '%s'", asset_id)
         
-        stmt = (
-            select(AssetData)
-            .options(joinedload(AssetData.spec_data))
-            .where(AssetData.AssetId == asset_id)
-        )
-        asset = self.session.scalars(stmt).first()
+        asset = self.session.scalars(_ASSET_BY_ID, {'asset_id': asset_id}).first()
         
         if not asset:
             return None
@@ -191,75 +278,87 @@ class AssetRepository(BaseRepository[AssetData]):
             'assetType': asset.AssetType,
             'specifications': specifications,
             'assignedTo': asset.AssignedTo,
-            'repairStatus': bool(asset.RepairStatus),
-            'isTempAsset': bool(asset.IsTempAsset),
-            'isRental': bool(asset.IsRental),
+            'repairStatus': asset.RepairStatus,
+            'isTempAsset': asset.IsTempAsset,
+            'isRental': asset.IsRental,
             'warrantyExpiry': asset.WarrantyExpiry,
             'leaseExpiry': asset.LeaseExpiry
         }
     
     def get_assignment_history(self, asset_id: str) -> List[dict]:
         """Get assignment history for an asset."""
-        logger.info(f"FETCH: Getting assignment history for '{asset_id}'")
+        logger.debug("FETCH: Getting assignment history for '%s'", asset_id)
         
         stmt = (
-            select(AssignmentHistory)
+            select(
+                AssignmentHistory.EmployeeId,
+                _history_employee_name,
+                _history_assigned_on,
+                _history_returned_on
+            )
+            .outerjoin(PeopleData, PeopleData.NameId == AssignmentHistory.EmployeeId)
             .where(AssignmentHistory.AssetId == asset_id)
             .order_by(AssignmentHistory.AssignedOn.desc())
         )
-        history = self.session.scalars(stmt).all()
         
         return [
             {
-                'employeeId': h.EmployeeId,
-                'employeeName': h.EmployeeName,
-                'assignedOn': h.AssignedOn.strftime('%Y-%m-%d') if h.AssignedOn else None,
-                'returnedOn': 'Active' if h.IsActive else (
-                    h.ReturnedOn.strftime('%Y-%m-%d') if h.ReturnedOn else None
-                )
+                'employeeId': employee_id,
+                'employeeName': employee_name,
+                'assignedOn': assigned_on,
+                'returnedOn': returned_on
             }
-            for h in history
+            for employee_id, employee_name, assigned_on, returned_on in self.session.execute(stmt)
         ]
     
     def get_all_assignment_history(self) -> Dict[str, List[dict]]:
         """Get all assignment history grouped by asset ID."""
-        logger.info("FETCH: Getting all assignment history")
+        logger.debug("FETCH: Getting all assignment history")
         
+        # MySQL groups the history into one JSON array per asset, so a single
+        # row per asset crosses the wire and dates arrive already formatted.
+        entry = func.json_object(
+            'employeeId', AssignmentHistory.EmployeeId,
+            'employeeName', _history_employee_name,
+            'assignedOn', _history_assigned_on,
+            'returnedOn', _history_returned_on
+        )
         stmt = (
-            select(AssignmentHistory)
-            .order_by(AssignmentHistory.AssetId, AssignmentHistory.AssignedOn.desc())
+            select(AssignmentHistory.AssetId, func.json_arrayagg(entry, type_=JSON))
+            .outerjoin(PeopleData, PeopleData.NameId == AssignmentHistory.EmployeeId)
+            .group_by(AssignmentHistory.AssetId)
+            .order_by(AssignmentHistory.AssetId)
         )
-        history = self.session.scalars(stmt).all()
         
         result = {}
-        for h in history:
-            if h.AssetId not in result:
-                result[h.AssetId] = []
-            result[h.AssetId].append({
-                'employeeId': h.EmployeeId,
-                'employeeName': h.EmployeeName,
-                'assignedOn': h.AssignedOn.strftime('%Y-%m-%d') if h.AssignedOn else None,
-                'returnedOn': 'Active' if h.IsActive else (
-                    h.ReturnedOn.strftime('%Y-%m-%d') if h.ReturnedOn else None
-                )
-            })
+        for asset_id, history in self.session.execute(stmt):
+            # JSON_ARRAYAGG has no ordering guarantee; restore newest first
+            history.sort(key=itemgetter('assignedOn'), reverse=True)
+            result[asset_id] = history
         
         return result
     
     def create(self, asset_data: dict, specifications: dict) -> dict:
         """Create a new asset with specifications."""
-        logger.info(f"CREATE: Starting asset creation for serial '{asset_data.get('serialNumber')}'")
+        logger.debug("CREATE: Starting asset creation for serial '%s'", asset_data.get('serialNumber'))
         
         try:
-            # Generate Asset ID
-            counter = self.session.get(AssetIdCounter, 1)
-            if not counter:
-                counter = AssetIdCounter(id=1, current_value=1000)
-                self.session.add(counter)
-            counter.current_value += 1
-            asset_id = f"AST_{counter.current_value}"
+            # Generate Asset ID: LAST_INSERT_ID(expr) reports the incremented
+            # value back on the UPDATE itself, so no follow-up SELECT is needed
+            result = self.session.execute(
+                update(AssetIdCounter)
+                .where(AssetIdCounter.id == 1)
+                .values(current_value=func.last_insert_id(AssetIdCounter.current_value + 1))
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount:
+                next_value = result.lastrowid
+            else:
+                next_value = 1001
+                self.session.add(AssetIdCounter(id=1, current_value=next_value))
+            asset_id = f"AST_{next_value}"
             
-            logger.info(f"CREATE: Generated Asset ID '{asset_id}'")
+            logger.debug("CREATE: Generated Asset ID '%s'", asset_id)
             
             # Parse dates
             purchase_date = asset_data.get('purchaseDate')
@@ -279,6 +378,7 @@ class AssetRepository(BaseRepository[AssetData]):
                     lease_expiry.replace('Z', '+00:00')
                 ).date()
             
+            asset_type = asset_data.get('assetType')
             assigned_to = asset_data.get('assignedTo') or None
             is_rental = asset_data.get('isRental', False)
             
@@ -286,7 +386,7 @@ class AssetRepository(BaseRepository[AssetData]):
             asset = AssetData(
                 AssetId=asset_id,
                 SerialNo=asset_data.get('serialNumber'),
-                AssetType=asset_data.get('assetType'),
+                AssetType=asset_type,
                 Brand=asset_data.get('brand'),
                 Model=asset_data.get('model'),
                 DateOfPurchase=purchase_date,
@@ -305,41 +405,37 @@ class AssetRepository(BaseRepository[AssetData]):
             self.session.add(asset)
             
             # Get field mapping
-            stmt = (
-                select(AssetSpecification)
-                .join(AssetType)
-                .where(AssetType.type_name == asset_data.get('assetType'))
-            )
-            spec_fields = self.session.scalars(stmt).all()
-            field_mapping = {s.field_key: s.field_label for s in spec_fields}
-            
-            # Insert specifications
-            for field_key, field_value in specifications.items():
-                if field_value:
-                    spec = SpecData(
-                        AssetId=asset_id,
-                        AssetTypeName=asset_data.get('assetType'),
-                        SpecFieldName=field_mapping.get(field_key, field_key),
-                        SpecFieldValue=field_value
-                    )
-                    self.session.add(spec)
+            field_mapping = self._field_mapping_for_type(asset_type)
+            
+            # Insert specifications in a single executemany round trip
+            spec_rows = [
+                {
+                    'AssetId': asset_id,
+                    'AssetTypeName': asset_type,
+                    'SpecFieldName': field_mapping.get(field_key, field_key),
+                    'SpecFieldValue': field_value
+                }
+                for field_key, field_value in specifications.items()
+                if field_value
+            ]
+            if spec_rows:
+                # SpecData references the asset row, which must exist first
+                self.session.flush()
+                self.session.execute(insert(SpecData), spec_rows)
             
             # Create assignment history if assigned
             if assigned_to:
-                employee = self.session.get(PeopleData, assigned_to)
-                emp_name = employee.Name if employee else assigned_to
-                
                 history = AssignmentHistory(
                     AssetId=asset_id,
                     EmployeeId=assigned_to,
-                    EmployeeName=emp_name,
                     AssignedOn=datetime.now().date(),
                     IsActive=True
                 )
                 self.session.add(history)
             
             self.session.commit()
-            logger.info(f"CREATE: Successfully created asset '{asset_id}'")
+            invalidate_summary_cache()
+            logger.info("CREATE: Successfully created asset '%s'", asset_id)
             
             return {
                 'success': True,
@@ -349,73 +445,82 @@ class AssetRepository(BaseRepository[AssetData]):
             
         except Exception as e:
             self.session.rollback()
-            logger.error(f"CREATE: Error - {e}")
+            logger.error("CREATE: Error - %s", e)
             raise
     
     def update_assignment(
         self, asset_id: str, new_employee_id: str, repair_status: bool
     ) -> dict:
         """Update asset assignment and repair status."""
-        logger.info(f"UPDATE: Updating assignment for '{asset_id}'")
+        logger.debug("UPDATE: Updating assignment for '%s'", asset_id)
         
         try:
-            asset = self.session.get(AssetData, asset_id)
-            if not asset:
+            # Blind writes: no read of the current assignment is needed
+            result = self.session.execute(
+                update(AssetData)
+                .where(AssetData.AssetId == asset_id)
+                .values(AssignedTo=new_employee_id or None, RepairStatus=repair_status)
+            )
+            if result.rowcount == 0:
                 raise Exception(f"Asset {asset_id} not found")
             
-            old_employee_id = asset.AssignedTo
+            today = datetime.now().date()
             
-            if old_employee_id != new_employee_id:
-                # Close old assignment
-                if old_employee_id:
-                    stmt = (
-                        update(AssignmentHistory)
-                        .where(AssignmentHistory.AssetId == asset_id)
-                        .where(AssignmentHistory.EmployeeId == old_employee_id)
-                        .where(AssignmentHistory.IsActive == True)
-                        .values(ReturnedOn=datetime.now().date(), IsActive=False)
+            # Close any active assignment held by someone else
+            close_stmt = (
+                update(AssignmentHistory)
+                .where(AssignmentHistory.AssetId == asset_id)
+                .where(AssignmentHistory.IsActive == True)
+                .values(ReturnedOn=today, IsActive=False)
+            )
+            if new_employee_id:
+                close_stmt = close_stmt.where(AssignmentHistory.EmployeeId != new_employee_id)
+            self.session.execute(close_stmt)
+            
+            # Open the new assignment unless it is already the active one
+            if new_employee_id:
+                new_row = select(
+                    literal(asset_id), literal(new_employee_id), literal(today), true()
+                ).where(
+                    ~exists().where(
+                        AssignmentHistory.AssetId == asset_id,
+                        AssignmentHistory.IsActive == True,
                     )
-                    self.session.execute(stmt)
-                
-                # Create new assignment
-                if new_employee_id:
-                    employee = self.session.get(PeopleData, new_employee_id)
-                    emp_name = employee.Name if employee else new_employee_id
-                    
-                    history = AssignmentHistory(
-                        AssetId=asset_id,
-                        EmployeeId=new_employee_id,
-                        EmployeeName=emp_name,
-                        AssignedOn=datetime.now().date(),
-                        IsActive=True
+                )
+                self.session.execute(
+                    insert(AssignmentHistory).from_select(
+                        ['AssetId', 'EmployeeId', 'AssignedOn', 'IsActive'], new_row
                     )
-                    self.session.add(history)
-            
-            # Update asset
-            asset.AssignedTo = new_employee_id or None
-            asset.RepairStatus = repair_status
+                )
             
             self.session.commit()
-            logger.info(f"UPDATE: Successfully updated '{asset_id}'")
+            invalidate_summary_cache()
+            logger.info("UPDATE: Successfully updated '%s'", asset_id)
             return {'success': True, 'message': f'Asset {asset_id} updated successfully'}
             
         except Exception as e:
             self.session.rollback()
-            logger.error(f"UPDATE: Error - {e}")
+            logger.error("UPDATE: Error - %s", e)
             raise
     
     def delete_bulk(self, asset_ids: List[str]) -> dict:
         """Delete multiple assets by their IDs."""
-        logger.info(f"DELETE: Deleting {len(asset_ids)} assets")
+        logger.debug("DELETE: Deleting %s assets", len(asset_ids))
         
         try:
-            # SQLAlchemy cascade will handle related records
-            stmt = delete(AssetData).where(AssetData.AssetId.in_(asset_ids))
+            # One statement: the ON DELETE CASCADE foreign keys remove SpecData,
+            # AssignmentHistory and RepairStatusTracker rows server-side
+            stmt = (
+                delete(AssetData)
+                .where(AssetData.AssetId.in_(asset_ids))
+                .execution_options(synchronize_session=False)
+            )
             result = self.session.execute(stmt)
             deleted_count = result.rowcount
             
             self.session.commit()
-            logger.info(f"DELETE: Successfully deleted {deleted_count} assets")
+            invalidate_summary_cache()
+            logger.info("DELETE: Successfully deleted %s assets", deleted_count)
             
             return {
                 'success': True,
@@ -425,12 +530,12 @@ class AssetRepository(BaseRepository[AssetData]):
             
         except Exception as e:
             self.session.rollback()
-            logger.error(f"DELETE: Error - {e}")
+            logger.error("DELETE: Error - %s", e)
             raise
 
     def get_available_temp_assets(self, asset_type: str, exclude_asset_id: str) -> List[dict]:
         """Get unassigned assets of same type for temp assignment."""
-        logger.info(f"FETCH: Getting available temp assets for type '{asset_type}'")
+        logger.debug("FETCH: Getting available temp assets for type '%s'", asset_type)
         stmt = (
             select(AssetData)
             .where(AssetData.AssetType == asset_type)
@@ -445,13 +550,8 @@ class AssetRepository(BaseRepository[AssetData]):
 
     def get_active_repair(self, asset_id: str) -> Optional[dict]:
         """Get active repair record for an asset."""
-        logger.info(f"FETCH: Getting active repair for '{asset_id}'")
-        stmt = (
-            select(RepairStatusTracker)
-            .where(RepairStatusTracker.AssetId == asset_id)
-            .where(RepairStatusTracker.RepairEndTimestamp == None)
-        )
-        repair = self.session.scalars(stmt).first()
+        logger.debug("FETCH: Getting active repair for '%s'", asset_id)
+        repair = self.session.scalars(_ACTIVE_REPAIR_BY_ASSET, {'asset_id': asset_id}).first()
         if not repair:
             return None
         return {
@@ -464,7 +564,7 @@ class AssetRepository(BaseRepository[AssetData]):
 
     def start_repair(self, asset_id: str, repair_details: str, temp_asset_id: Optional[str] = None) -> dict:
         """Start repair for an asset."""
-        logger.info(f"REPAIR START: Asset '{asset_id}', TempAsset='{temp_asset_id}'")
+        logger.debug("REPAIR START: Asset '%s', TempAsset='%s'", asset_id, temp_asset_id)
         try:
             asset = self.session.get(AssetData, asset_id)
             if not asset:
@@ -486,13 +586,9 @@ class AssetRepository(BaseRepository[AssetData]):
                 temp_asset.AssignedTo = current_employee_id
                 
                 # Create assignment history for temp asset
-                employee = self.session.get(PeopleData, current_employee_id)
-                emp_name = employee.Name if employee else current_employee_id
-                
                 history = AssignmentHistory(
                     AssetId=temp_asset_id,
                     EmployeeId=current_employee_id,
-                    EmployeeName=emp_name,
                     AssignedOn=datetime.now().date(),
                     IsActive=True
                 )
@@ -507,66 +603,69 @@ class AssetRepository(BaseRepository[AssetData]):
             self.session.add(repair_record)
             
             self.session.commit()
-            logger.info(f"REPAIR START: Successfully started repair for '{asset_id}'")
+            invalidate_summary_cache()
+            logger.info("REPAIR START: Successfully started repair for '%s'", asset_id)
             return {'success': True, 'message': f'Repair started for {asset_id}'}
             
         except Exception as e:
             self.session.rollback()
-            logger.error(f"REPAIR START: Error - {e}")
+            logger.error("REPAIR START: Error - %s", e)
             raise
 
     def end_repair(self, asset_id: str) -> dict:
         """End repair for an asset."""
-        logger.info(f"REPAIR END: Asset '{asset_id}'")
+        logger.debug("REPAIR END: Asset '%s'", asset_id)
         try:
-            asset = self.session.get(AssetData, asset_id)
-            if not asset:
-                raise Exception(f"Asset {asset_id} not found")
-            
-            # Get active repair record
+            # Get active repair record (only the columns needed below)
             stmt = (
-                select(RepairStatusTracker)
+                select(RepairStatusTracker.id, RepairStatusTracker.TempAssetId)
                 .where(RepairStatusTracker.AssetId == asset_id)
                 .where(RepairStatusTracker.RepairEndTimestamp == None)
             )
-            repair = self.session.scalars(stmt).first()
+            repair = self.session.execute(stmt).first()
             
             if not repair:
                 raise Exception(f"No active repair found for {asset_id}")
+            repair_id, temp_asset_id = repair
             
             # Handle temp asset if exists and is different from main asset
-            if repair.TempAssetId and repair.TempAssetId != asset_id:
-                temp_asset = self.session.get(AssetData, repair.TempAssetId)
-                if temp_asset and temp_asset.IsTempAsset:
+            if temp_asset_id and temp_asset_id != asset_id:
+                # Reset temp asset; the flag guard makes this a no-op if it was
+                # already released, in which case its history is left alone
+                stmt = (
+                    update(AssetData)
+                    .where(AssetData.AssetId == temp_asset_id)
+                    .where(AssetData.IsTempAsset == True)
+                    .values(IsTempAsset=False, AssignedTo=None)
+                )
+                if self.session.execute(stmt).rowcount:
                     # Close temp asset assignment
-                    if temp_asset.AssignedTo:
-                        stmt = (
-                            update(AssignmentHistory)
-                            .where(AssignmentHistory.AssetId == repair.TempAssetId)
-                            .where(AssignmentHistory.IsActive == True)
-                            .values(ReturnedOn=datetime.now().date(), IsActive=False)
-                        )
-                        self.session.execute(stmt)
-                    
-                    # Reset temp asset
-                    temp_asset.IsTempAsset = False
-                    temp_asset.AssignedTo = None
+                    stmt = (
+                        update(AssignmentHistory)
+                        .where(AssignmentHistory.AssetId == temp_asset_id)
+                        .where(AssignmentHistory.IsActive == True)
+                        .values(ReturnedOn=datetime.now().date(), IsActive=False)
+                    )
+                    self.session.execute(stmt)
             
             # End repair
-            repair.RepairEndTimestamp = datetime.now()
-            asset.RepairStatus = False
+            self.session.execute(
+                update(RepairStatusTracker)
+                .where(RepairStatusTracker.id == repair_id)
+                .values(RepairEndTimestamp=datetime.now())
+            )
+            self.session.execute(
+                update(AssetData)
+                .where(AssetData.AssetId == asset_id)
+                .values(RepairStatus=False)
+            )
             
             self.session.commit()
-            logger.info(f"REPAIR END: Successfully ended repair for '{asset_id}'")
+            invalidate_summary_cache()
+            logger.info("REPAIR END: Successfully ended repair for '%s'", asset_id)
             return {'success': True, 'message': f'Repair ended for {asset_id}'}
             
         except Exception as e:
             self.session.rollback()
-            logger.error(f"REPAIR END: Error - {e}")
+            logger.error("REPAIR END: Error - %s", e)
             raise
-
-
-
-
-
-
@@ -1,8 +1,12 @@
 """Authentication repository using SQLAlchemy ORM."""
+import base64
+import binascii
 import logging
+import secrets
 from typing import Optional
 
-from sqlalchemy import select
+import bcrypt
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.orm import Session
 
 from app.db.repositories.base import BaseRepository
@@ -12,6 +16,67 @@ from datetime import datetime, timezone
 
 logger = logging.getLogger('db.auth_repository')
 
+# Hot point lookups are built once; each call only binds parameters and hits
+# SQLAlchemy's compiled-statement cache.
+_USER_BY_USERNAME = select(AuthData).where(AuthData.username == bindparam('username'))
+_USER_BY_REFRESH_TOKEN = select(AuthData).where(AuthData.refresh_token == bindparam('refresh_token'))
+# Refresh-token writes touch one row by primary key; run them as plain UPDATEs
+_SET_REFRESH_TOKEN = (
+    update(AuthData)
+    .where(AuthData.id == bindparam('user_id'))
+    .values(refresh_token=bindparam('token'), refresh_token_expires_at=bindparam('expires_at'))
+    .execution_options(synchronize_session=False)
+)
+
+
+# bcrypt only uses the first 72 bytes of a password, and bcrypt>=5 raises
+# ValueError on anything longer instead of truncating
+_BCRYPT_MAX_PASSWORD_BYTES = 72
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with bcrypt for storage in AuthData.password."""
+    encoded = password.encode()
+    if len(encoded) > _BCRYPT_MAX_PASSWORD_BYTES:
+        raise ValueError(f"Password longer than {_BCRYPT_MAX_PASSWORD_BYTES} bytes")
+    return bcrypt.hashpw(encoded, bcrypt.gensalt()).decode()
+
+
+def _is_hashed(stored: str) -> bool:
+    return stored.startswith(('$2a$', '$2b$', '$2y$'))
+
+
+def _check_password(password: str, stored: str) -> bool:
+    """Check a password against a stored bcrypt hash (or legacy plaintext)."""
+    encoded = password.encode()
+    if _is_hashed(stored):
+        if len(encoded) > _BCRYPT_MAX_PASSWORD_BYTES:
+            return False
+        try:
+            return bcrypt.checkpw(encoded, stored.encode())
+        except ValueError:
+            # Malformed stored hash ("Invalid salt"): treat as a failed login
+            logger.error("Stored password hash is malformed")
+            return False
+    return secrets.compare_digest(encoded, stored.encode())
+
+
+def _refresh_token_bytes(refresh_token: str) -> Optional[bytes]:
+    """Decode a client refresh token to the 16 bytes stored in AuthData."""
+    # 16 bytes are always 22 unpadded base64url characters. Decoding strictly
+    # rejects stray characters the lenient decoder would silently drop, and
+    # the round trip rejects '+'/'/' aliases and non-canonical final
+    # characters, so each stored token has exactly one accepted spelling.
+    if len(refresh_token) != 22:
+        return None
+    try:
+        raw = base64.b64decode(refresh_token + '==', altchars=b'-_', validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    if base64.urlsafe_b64encode(raw).rstrip(b'=').decode() != refresh_token:
+        return None
+    return raw
+
 
 class AuthRepository(BaseRepository[AuthData]):
     """Repository for authentication operations using SQLAlchemy ORM."""
@@ -21,16 +86,17 @@ class AuthRepository(BaseRepository[AuthData]):
     
     def verify_user(self, username: str, password: str) -> Optional[dict]:
         """Verify user credentials against the AuthData table."""
-        logger.info(f"AUTH REQUEST: Verifying user '{username}'")
+        logger.debug("AUTH REQUEST: Verifying user '%s'", username)
         
-        stmt = select(AuthData).where(
-            AuthData.username == username,
-            AuthData.password == password
-        )
-        user = self.session.scalars(stmt).first()
+        # Look up by username only (unique index); the password is checked here
+        user = self.session.scalars(_USER_BY_USERNAME, {'username': username}).first()
         
-        if user:
-            logger.info(f"AUTH REQUEST: User '{username}' authenticated successfully")
+        if user and _check_password(password, user.password):
+            # Legacy passwords too long for bcrypt stay as they are
+            if (not _is_hashed(user.password)
+                    and len(password.encode()) <= _BCRYPT_MAX_PASSWORD_BYTES):
+                self._upgrade_password_hash(user, password)
+            logger.info("AUTH REQUEST: User '%s' authenticated successfully", username)
             return {
                 'id': user.id,
                 'username': user.username,
@@ -38,34 +104,48 @@ class AuthRepository(BaseRepository[AuthData]):
                 'email': user.email
             }
         
-        logger.warning(f"AUTH REQUEST: Authentication failed for user '{username}'")
+        logger.warning("AUTH REQUEST: Authentication failed for user '%s'", username)
         return None
     
+    def _upgrade_password_hash(self, user: AuthData, password: str) -> None:
+        """Replace a legacy plaintext password with its bcrypt hash."""
+        try:
+            user.password = hash_password(password)
+            self.session.commit()
+            logger.info("AUTH REQUEST: Upgraded stored password hash for user_id=%s", user.id)
+        except Exception as e:
+            logger.error("Failed to upgrade password hash: %s", e)
+            self.session.rollback()
+    
     # ADD these methods inside AuthRepository class (after verify_user method):
 
     def update_refresh_token(self, user_id: int, refresh_token: str, expires_at: datetime) -> bool:
         """Store refresh token in database."""
         try:
-            stmt = select(AuthData).where(AuthData.id == user_id)
-            user = self.session.scalars(stmt).first()
-            if user:
-                user.refresh_token = refresh_token
-                user.refresh_token_expires_at = expires_at
-                self.session.commit()
-                logger.info(f"Refresh token updated for user_id={user_id}")
+            result = self.session.execute(
+                _SET_REFRESH_TOKEN,
+                {
+                    'user_id': user_id,
+                    'token': _refresh_token_bytes(refresh_token),
+                    'expires_at': expires_at
+                }
+            )
+            self.session.commit()
+            if result.rowcount:
+                logger.debug("Refresh token updated for user_id=%s", user_id)
                 return True
             return False
         except Exception as e:
-            logger.error(f"Failed to update refresh token: {e}")
+            logger.error("Failed to update refresh token: %s", e)
             self.session.rollback()
             return False
 
     def validate_refresh_token(self, refresh_token: str) -> Optional[dict]:
         """Validate refresh token and return user if valid."""
-        stmt = select(AuthData).where(
-            AuthData.refresh_token == refresh_token
-        )
-        user = self.session.scalars(stmt).first()
+        token = _refresh_token_bytes(refresh_token)
+        user = None
+        if token is not None:
+            user = self.session.scalars(_USER_BY_REFRESH_TOKEN, {'refresh_token': token}).first()
         
         if not user:
             logger.warning("Refresh token not found in database")
@@ -80,10 +160,10 @@ class AuthRepository(BaseRepository[AuthData]):
         now = datetime.now(timezone.utc) if expires_at.tzinfo else datetime.utcnow()
         
         if expires_at < now:
-            logger.warning(f"Refresh token expired for user_id={user.id}")
+            logger.warning("Refresh token expired for user_id=%s", user.id)
             return None
         
-        logger.info(f"Refresh token validated for user_id={user.id}")
+        logger.debug("Refresh token validated for user_id=%s", user.id)
         return {
             'id': user.id,
             'username': user.username,
@@ -94,16 +174,16 @@ class AuthRepository(BaseRepository[AuthData]):
     def invalidate_refresh_token(self, user_id: int) -> bool:
         """Invalidate refresh token (logout)."""
         try:
-            stmt = select(AuthData).where(AuthData.id == user_id)
-            user = self.session.scalars(stmt).first()
-            if user:
-                user.refresh_token = None
-                user.refresh_token_expires_at = None
-                self.session.commit()
-                logger.info(f"Refresh token invalidated for user_id={user_id}")
+            result = self.session.execute(
+                _SET_REFRESH_TOKEN,
+                {'user_id': user_id, 'token': None, 'expires_at': None}
+            )
+            self.session.commit()
+            if result.rowcount:
+                logger.info("Refresh token invalidated for user_id=%s", user_id)
                 return True
             return False
         except Exception as e:
-            logger.error(f"Failed to invalidate refresh token: {e}")
+            logger.error("Failed to invalidate refresh token: %s", e)
             self.session.rollback()
             return False
\ No newline at end of file
@@ -5,11 +5,16 @@ from typing import Optional, Dict
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.db.cache import QueryCache
 from app.db.repositories.base import BaseRepository
 from app.db.models import PeopleData
 
 logger = logging.getLogger('db.employee_repository')
 
+# The employee directory is maintained outside this app; a short TTL keeps
+# the per-page-load employee list from hitting the database every time.
+_employee_cache = QueryCache(maxsize=1, ttl=60)
+
 
 class EmployeeRepository(BaseRepository[PeopleData]):
     """Repository for employee operations using SQLAlchemy ORM."""
@@ -18,27 +23,28 @@ class EmployeeRepository(BaseRepository[PeopleData]):
         super().__init__(PeopleData, session)
     
     def get_all(self) -> Dict[str, dict]:
-        """Get all employees."""
-        logger.info("FETCH: Getting all employees")
+        """Get all employees (cached)."""
+        return _employee_cache.get_or_load('employees', self._load_all)
+    
+    def _load_all(self) -> Dict[str, dict]:
+        logger.debug("FETCH: Getting all employees")
         
-        stmt = select(PeopleData).order_by(PeopleData.Name)
-        employees = self.session.scalars(stmt).all()
+        # Column rows skip ORM identity-map and attribute instrumentation
+        stmt = select(
+            PeopleData.NameId, PeopleData.Name, PeopleData.Department, PeopleData.Email
+        ).order_by(PeopleData.Name)
         
         result = {
-            emp.NameId: {
-                'name': emp.Name,
-                'department': emp.Department,
-                'email': emp.Email
-            }
-            for emp in employees
+            name_id: {'name': name, 'department': department, 'email': email}
+            for name_id, name, department, email in self.session.execute(stmt)
         }
         
-        logger.info(f"FETCH: Retrieved {len(result)} employees")
+        logger.debug("FETCH: Retrieved %s employees", len(result))
         return result
     
     def get_by_id(self, employee_id: str) -> Optional[dict]:
         """Get a single employee by ID."""
-        logger.info(f"FETCH: Getting employee '{employee_id}'")
+        logger.debug("FETCH: Getting employee '%s'", employee_id)
         
         employee = self.session.get(PeopleData, employee_id)
         
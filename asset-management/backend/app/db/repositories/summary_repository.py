@@ -5,11 +5,21 @@ from typing import List
 from sqlalchemy import select, func, text
 from sqlalchemy.orm import Session
 
+from app.db.cache import QueryCache
 from app.db.repositories.base import BaseRepository
 from app.db.models import AssetData, PeopleData
 
 logger = logging.getLogger('db.summary_repository')
 
+# The dashboard polls the summary; it only changes when assets are written,
+# and AssetRepository drops it via invalidate_summary_cache() when they are.
+_summary_cache = QueryCache(maxsize=1, ttl=30)
+
+
+def invalidate_summary_cache() -> None:
+    """Drop the cached summary after an asset or assignment write."""
+    _summary_cache.invalidate()
+
 
 class SummaryRepository:
     """Repository for summary operations using SQLAlchemy ORM."""
@@ -19,7 +29,10 @@ class SummaryRepository:
     
     def get_summary_data(self) -> List[dict]:
         """Get summary data (replaces the SQL View query)."""
-        logger.info("FETCH: Getting summary data")
+        return _summary_cache.get_or_load('summary', self._load_summary_data)
+    
+    def _load_summary_data(self) -> List[dict]:
+        logger.debug("FETCH: Getting summary data")
         
         # Query equivalent to the SummaryData view
         stmt = (
@@ -40,18 +53,8 @@ class SummaryRepository:
             .order_by(AssetData.AssetType)
         )
         
-        results = self.session.execute(stmt).all()
-        
-        data = [
-            {
-                'AssetType': row.AssetType,
-                'Department': row.Department,
-                'Brand': row.Brand,
-                'Model': row.Model,
-                'Count': row.Count
-            }
-            for row in results
-        ]
+        # Column labels already match the response keys
+        data = [dict(row) for row in self.session.execute(stmt).mappings()]
         
-        logger.info(f"FETCH: Retrieved {len(data)} summary rows")
+        logger.debug("FETCH: Retrieved %s summary rows", len(data))
         return data
\ No newline at end of file
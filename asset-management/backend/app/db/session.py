@@ -40,19 +40,15 @@ class DatabaseManager:
 
     def _init_engine(self):
         """Initialize the SQLAlchemy engine with connection pooling."""
-        database_url = (
-            f"mysql+mysqlconnector://{settings.DB_USER}:{settings.DB_PASSWORD}"
-            f"@{settings.DB_HOST}/{settings.DB_NAME}"
-        )
-        
         self._engine = create_engine(
-            database_url,
+            settings.database_url,
             poolclass=QueuePool,
-            pool_size=5,              # Maintain 5 connections in pool
-            max_overflow=10,          # Allow up to 10 additional connections
-            pool_timeout=30,          # Wait 30s for connection before timeout
-            pool_recycle=1800,        # Recycle connections after 30 minutes
+            pool_size=settings.DB_POOL_SIZE,          # Persistent connections kept in pool
+            max_overflow=settings.DB_MAX_OVERFLOW,    # Burst connections opened when pool is exhausted
+            pool_timeout=settings.DB_POOL_TIMEOUT,    # Seconds to wait for a free connection
+            pool_recycle=settings.DB_POOL_RECYCLE,    # Recycle connections older than this (seconds)
             pool_pre_ping=True,       # Verify connection health before use
+            query_cache_size=settings.DB_QUERY_CACHE_SIZE,  # LRU of compiled SQL statements
             echo=settings.DEBUG,      # Log SQL in debug mode
         )
         
@@ -64,8 +60,8 @@ class DatabaseManager:
         )
         
         logger.info(
-            f"Database engine initialized with connection pool "
-            f"(pool_size=5, max_overflow=10)"
+            "Database engine initialized with connection pool (pool_size=%s, max_overflow=%s)",
+            settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
         )
 
     @property
@@ -101,14 +97,34 @@ class DatabaseManager:
     def test_connection(self) -> bool:
         """Test database connectivity."""
         try:
-            with self.session_scope() as session:
-                session.execute(text("SELECT 1"))
+            # A bare pooled connection in autocommit mode: no session, no COMMIT
+            with self._engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.execute(text("SELECT 1"))
             logger.info("Database connection test: SUCCESS")
             return True
         except Exception as e:
-            logger.error(f"Database connection test: FAILED - {e}")
+            logger.error("Database connection test: FAILED - %s", e)
             return False
 
+    def warm_up(self) -> int:
+        """
+        Open DB_POOL_WARMUP connections (at most pool_size) up front so the
+        first requests after startup don't pay for TCP + auth handshakes.
+        Returns how many opened.
+        """
+        connections = []
+        try:
+            for _ in range(min(settings.DB_POOL_WARMUP, settings.DB_POOL_SIZE)):
+                connections.append(self._engine.connect())
+        except Exception as e:
+            logger.error("Connection pool warm-up stopped early: %s", e)
+        finally:
+            # Closing returns them to the pool, where they stay open
+            for conn in connections:
+                conn.close()
+        logger.info("Connection pool warmed with %s connections", len(connections))
+        return len(connections)
+
     def dispose(self):
         """Dispose of the connection pool (for shutdown)."""
         if self._engine:
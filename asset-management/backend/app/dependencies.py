@@ -1,21 +1,36 @@
 """Shared dependencies for the application."""
 import logging
+from functools import lru_cache
+
 from fastapi import Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.services.auth_service import AuthService
 
 logger = logging.getLogger('dependencies')
-security = HTTPBearer()
-auth_service = AuthService()
+
+
+@lru_cache
+def get_security() -> HTTPBearer:
+    """Shared bearer-token extractor."""
+    return HTTPBearer()
+
+
+@lru_cache
+def get_auth_service() -> AuthService:
+    """Shared session-less AuthService for token verification."""
+    return AuthService()
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    credentials: HTTPAuthorizationCredentials = Depends(get_security()),
+    auth_service: AuthService = Depends(get_auth_service)
 ) -> dict:
     """Dependency to get current authenticated user."""
     token = credentials.credentials
-    payload = auth_service.verify_token(token)
+    # jwt.decode is CPU-bound; keep it off the event loop
+    payload = await run_in_threadpool(auth_service.verify_token, token)
     if not payload:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
     return payload
\ No newline at end of file
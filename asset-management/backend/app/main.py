@@ -1,86 +1,110 @@
 """FastAPI application initialization."""
-import os
+import asyncio
+import atexit
 import logging
+import queue
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
 from app.config import settings
 from app.api.router import api_router
-from app.api.routes.frontend import router as frontend_router
+from app.api.middleware import APIGZipMiddleware
+from app.api.responses import ORJSONResponse
+from app.api.routes.frontend import (
+    router as frontend_router, load_asset_cache, load_index_html, load_static_files, FRONTEND_DIST
+)
 from app.db.init_db import init_database
 from app.db.session import db_manager
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
+# Configure logging: request threads only enqueue records, a background
+# listener thread does the formatting and stream writes.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
-)
+))
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+log_listener = QueueListener(_log_queue, _log_handler)
+logging.basicConfig(level=settings.LOG_LEVEL, handlers=[_queue_handler])
+log_listener.start()
+# Stopped at interpreter exit, not per lifespan: the listener is started once
+# at import and a stopped QueueListener cannot be restarted
+atexit.register(log_listener.stop)
 logger = logging.getLogger('main')
 
-FRONTEND_DIST_ABS = os.path.abspath(
-    os.path.join(os.path.dirname(__file__), '..', settings.FRONTEND_DIST_PATH)
-)
-
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    print("\n" + "=" * 50)
-    print("Starting IT Asset Management Server")
-    print("=" * 50)
+    # Startup details are collected and logged as one record
+    lines = ["Starting IT Asset Management Server"]
     
-    print("\nInitializing Database...")
-    if init_database():
-        print("Database ready!")
-        print(f"Connection pool: pool_size=5, max_overflow=10")
+    db_available = True
+    if settings.SKIP_DB_INIT:
+        lines.append("Database: initialization skipped (SKIP_DB_INIT set)")
+    # DDL and seeding block, so keep them off the event loop
+    elif await asyncio.to_thread(init_database):
+        lines.append(
+            f"Database: ready (pool_size={settings.DB_POOL_SIZE}, "
+            f"max_overflow={settings.DB_MAX_OVERFLOW})"
+        )
     else:
-        print("Database initialization failed - running in offline mode")
+        db_available = False
+        logger.error("Database initialization failed - running in offline mode")
+        lines.append("Database: offline")
+    
+    # Pre-open connections so early requests skip connection setup; skipped
+    # when offline, where it would only wait out another connect timeout
+    if db_available:
+        await asyncio.to_thread(db_manager.warm_up)
     
-    print(f"\nFrontend path: {FRONTEND_DIST_ABS}")
-    print(f"JWT Expiry: {settings.JWT_EXPIRY_HOURS} hours")
-    print("=" * 50 + "\n")
+    lines.append(f"Frontend path: {FRONTEND_DIST}")
+    if not load_index_html():
+        lines.append("Frontend not built - index.html missing")
+    lines.append(f"Static assets cached in memory: {load_asset_cache()}")
+    lines.append(f"Frontend files cached: {load_static_files()}")
+    lines.append(f"JWT Expiry: {settings.JWT_EXPIRY_HOURS} hours")
+    logger.info("\n".join(lines))
     
     yield
     
     # Cleanup: dispose connection pool on shutdown
-    print("Disposing database connection pool...")
     db_manager.dispose()
-    print("Server shutting down...")
+    logger.info("Server shutting down")
 
 
 app = FastAPI(
     title="IT Asset Management API",
     description="Backend API for IT Asset Management System",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# Compress JSON list payloads (assets, employees, history). Frontend routes
+# serve their own precompressed variants and are left alone.
+app.add_middleware(APIGZipMiddleware, path_prefix="/api/", minimum_size=1000, compresslevel=5)
+
 # CORS middleware
 # IMPORTANT: When using credentials (cookies), cannot use wildcard '*'
 # Must specify exact origins
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",      # Frontend dev server (Vite)
-        "http://127.0.0.1:3000",      # Frontend dev server (127.0.0.1)
-        "http://localhost:8000",      # Backend serving frontend
-        "http://127.0.0.1:8000",      # Backend serving frontend (127.0.0.1)
-        "https://localhost",          # HTTPS production
-        "https://127.0.0.1",          # HTTPS production (127.0.0.1)
-    ],
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,  # ← CRITICAL: Allow cookies to be sent
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,           # Let browsers reuse preflight results for 24h
 )
 
-# Mount static files
-assets_path = os.path.join(FRONTEND_DIST_ABS, 'assets')
-if os.path.exists(assets_path):
-    app.mount("/assets", StaticFiles(directory=assets_path), name="assets")
-
 # Include routers
 app.include_router(api_router, prefix="/api")
 app.include_router(frontend_router)
\ No newline at end of file
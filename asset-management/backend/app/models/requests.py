@@ -1,19 +1,26 @@
-"""Request models."""
-from typing import Optional, Dict, List
-from pydantic import BaseModel
+"""Request models.
+
+Request bodies are frozen: handlers read them and never modify them.
+"""
+from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class LoginRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     username: str
     password: str
 
 
 class AssetCreateRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+    
     assetType: str
     serialNumber: str
     brand: str
     model: str
-    specifications: dict = {}
+    specifications: dict = Field(default_factory=dict)
     purchaseDate: Optional[str] = None
     purchaseCost: Optional[float] = None
     gstPaid: Optional[float] = None
@@ -26,22 +33,34 @@ class AssetCreateRequest(BaseModel):
 
 
 class AssetUpdateRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     assignedTo: Optional[str] = None
     repairStatus: bool = False
 
 
 class BulkDeleteRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     assetIds: List[str]
 
+
 class BrandModelCreateRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+    
     brandName: str
     modelName: str
 
+
 class RepairStartRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     assetId: str
     repairDetails: str
     tempAssetId: Optional[str] = None
 
 
 class RepairEndRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     assetId: str
\ No newline at end of file
@@ -15,10 +15,10 @@ class AssetService:
     
     def create_asset(self, asset_data: dict, specifications: dict) -> dict:
         """Create a new asset with specifications."""
-        logger.info(f"Creating asset: serial='{asset_data.get('serialNumber')}'")
+        logger.debug("Creating asset: serial='%s'", asset_data.get('serialNumber'))
         return self.asset_repo.create(asset_data, specifications)
     
     def update_assignment(self, asset_id: str, new_employee_id: str, repair_status: bool) -> dict:
         """Update asset assignment and repair status."""
-        logger.info(f"Updating assignment for '{asset_id}'")
+        logger.debug("Updating assignment for '%s'", asset_id)
         return self.asset_repo.update_assignment(asset_id, new_employee_id, repair_status)
\ No newline at end of file
@@ -1,10 +1,16 @@
 """Authentication service with access + refresh token support."""
+import base64
+import hashlib
 import logging
 import secrets
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple
 
-from jose import JWTError, jwt
+import jwt
+from cachetools import TLRUCache
+from jwt import InvalidTokenError
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -12,6 +18,28 @@ from app.db.repositories.auth_repository import AuthRepository
 
 logger = logging.getLogger('services.auth')
 
+# Token settings are fixed for the life of the process. The key is encoded
+# once here rather than by PyJWT on every encode/decode.
+_JWT_KEY = settings.JWT_SECRET_KEY.encode()
+_JWT_ALG = settings.JWT_ALGORITHM
+_JWT_ALGORITHMS = [_JWT_ALG]
+# Access tokens carry no audience, so skip that check; exp is required because
+# the verification cache below keys entry lifetimes off it.
+_JWT_DECODE_OPTIONS = {"require": ["exp"], "verify_aud": False}
+_ACCESS_TOKEN_TTL = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TOKEN_TTL = timedelta(hours=settings.REFRESH_TOKEN_EXPIRE_HOURS)
+_TOKEN_CACHE_TTL = settings.TOKEN_CACHE_TTL
+
+# Payloads of recently verified access tokens, keyed by a digest of the token,
+# so repeat requests from the same client skip the signature check. Entries
+# live for TOKEN_CACHE_TTL seconds but never past the token's own exp.
+_token_cache = TLRUCache(
+    maxsize=settings.TOKEN_CACHE_SIZE,
+    ttu=lambda _key, payload, now: min(payload['exp'], now + _TOKEN_CACHE_TTL),
+    timer=time.time
+)
+_token_cache_lock = threading.Lock()
+
 
 class AuthService:
     """Handles authentication logic with access and refresh tokens."""
@@ -20,33 +48,49 @@ class AuthService:
     
     def __init__(self, session: Optional[Session] = None):
         self.session = session
+        self._auth_repo: Optional[AuthRepository] = None
+    
+    @property
+    def auth_repo(self) -> AuthRepository:
+        """AuthRepository for this session, built on first DB access."""
+        if self._auth_repo is None:
+            self._auth_repo = AuthRepository(self.session)
+        return self._auth_repo
     
     def create_access_token(self, data: dict) -> Tuple[str, datetime]:
         """Create short-lived JWT access token (15 min)."""
-        expires_at = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expires_at = datetime.now(timezone.utc) + _ACCESS_TOKEN_TTL
         to_encode = data.copy()
         to_encode.update({"exp": expires_at, "type": "access"})
-        token = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-        logger.info(f"Access token created for user '{data.get('username')}', expires at {expires_at}")
+        token = jwt.encode(to_encode, _JWT_KEY, algorithm=_JWT_ALG)
+        logger.debug("Access token created for user '%s', expires at %s", data.get('username'), expires_at)
         return token, expires_at
     
     def create_refresh_token(self) -> Tuple[str, datetime]:
-        """Create secure random refresh token (24 hours)."""
-        token = secrets.token_urlsafe(32)
-        expires_at = datetime.now(timezone.utc) + timedelta(hours=settings.REFRESH_TOKEN_EXPIRE_HOURS)
+        """Create secure random 128-bit refresh token (24 hours)."""
+        token = base64.urlsafe_b64encode(secrets.token_bytes(16)).rstrip(b'=').decode()
+        expires_at = datetime.now(timezone.utc) + _REFRESH_TOKEN_TTL
         return token, expires_at
     
     def verify_token(self, token: str) -> Optional[dict]:
         """Verify JWT access token and return payload."""
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        with _token_cache_lock:
+            payload = _token_cache.get(key)
+        if payload is not None and payload['exp'] > time.time():
+            return payload
+        
         try:
-            payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+            payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS, options=_JWT_DECODE_OPTIONS)
             if payload.get('type') != 'access':
                 logger.warning("Token is not an access token")
                 return None
-            logger.info(f"Access token verified for user '{payload.get('username')}'")
+            logger.debug("Access token verified for user '%s'", payload.get('username'))
+            with _token_cache_lock:
+                _token_cache[key] = payload
             return payload
-        except JWTError as e:
-            logger.warning(f"Access token verification failed - {str(e)}")
+        except InvalidTokenError as e:
+            logger.warning("Access token verification failed - %s", e)
             return None
     
     def authenticate(self, username: str, password: str) -> Optional[dict]:
@@ -57,14 +101,14 @@ class AuthService:
         
         # Try database authentication
         if self.session:
-            auth_repo = AuthRepository(self.session)
-            user = auth_repo.verify_user(username, password)
+            user = self.auth_repo.verify_user(username, password)
             if user:
                 user_id = user['id']
                 full_name = user.get('full_name', username)
         
         # Fallback for development
-        if not user and self.FALLBACK_USERS.get(username) == password:
+        expected = self.FALLBACK_USERS.get(username)
+        if not user and expected is not None and secrets.compare_digest(expected.encode(), password.encode()):
             user = {'username': username}
             user_id = 0
             full_name = "IT Administrator" if username == "itadmin" else username
@@ -84,8 +128,7 @@ class AuthService:
         
         # Store refresh token in DB (skip for fallback users)
         if self.session and user_id > 0:
-            auth_repo = AuthRepository(self.session)
-            auth_repo.update_refresh_token(user_id, refresh_token, refresh_expires)
+            self.auth_repo.update_refresh_token(user_id, refresh_token, refresh_expires)
         
         return {
             "success": True,
@@ -104,8 +147,7 @@ class AuthService:
             logger.error("No database session for refresh token validation")
             return None
         
-        auth_repo = AuthRepository(self.session)
-        user = auth_repo.validate_refresh_token(refresh_token)
+        user = self.auth_repo.validate_refresh_token(refresh_token)
         
         if not user:
             return None
@@ -119,7 +161,7 @@ class AuthService:
         
         # Rotate refresh token
         new_refresh_token, refresh_expires = self.create_refresh_token()
-        auth_repo.update_refresh_token(user['id'], new_refresh_token, refresh_expires)
+        self.auth_repo.update_refresh_token(user['id'], new_refresh_token, refresh_expires)
         
         return {
             "success": True,
@@ -134,8 +176,7 @@ class AuthService:
         if not self.session or user_id <= 0:
             return True  # Fallback users don't have DB tokens
         
-        auth_repo = AuthRepository(self.session)
-        return auth_repo.invalidate_refresh_token(user_id)
+        return self.auth_repo.invalidate_refresh_token(user_id)
     
 
     def validate_refresh_for_logout(self, refresh_token: str) -> Optional[dict]:
@@ -143,5 +184,4 @@ class AuthService:
         if not self.session:
             return None
         
-        auth_repo = AuthRepository(self.session)
-        return auth_repo.validate_refresh_token(refresh_token)
\ No newline at end of file
+        return self.auth_repo.validate_refresh_token(refresh_token)
\ No newline at end of file
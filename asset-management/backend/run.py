@@ -8,5 +8,7 @@ if __name__ == "__main__":
         "app.main:app",
         host=settings.SERVER_HOST,
         port=settings.SERVER_PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        # reload and multiple workers are mutually exclusive
+        workers=1 if settings.DEBUG else settings.UVICORN_WORKERS
     )
\ No newline at end of file
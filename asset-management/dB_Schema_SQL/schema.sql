@@ -89,7 +89,6 @@ CREATE TABLE AssignmentHistory (
             id INT AUTO_INCREMENT PRIMARY KEY,
             AssetId VARCHAR(100) NOT NULL,
             EmployeeId VARCHAR(250) NOT NULL,
-            EmployeeName VARCHAR(250),
             AssignedOn DATE NOT NULL,
             ReturnedOn DATE DEFAULT NULL,
             IsActive BOOLEAN DEFAULT TRUE,